@@ -1,6 +1,7 @@
 """Authentication module for Google Workspace APIs."""
 
 import asyncio
+import json
 import logging
 import os
 import pickle
@@ -171,8 +172,6 @@ class GoogleAuthManager:
 
     def _is_service_account(self) -> bool:
         """Check if the credentials file is a service account key."""
-        import json
-
         try:
             if not self.credentials_path:
                 return False
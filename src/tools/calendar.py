@@ -2,9 +2,7 @@
 
 import html
 import logging
-import os
 import re
-import sys
 from datetime import datetime
 from typing import Any, Dict, Optional, TypedDict, cast
 from urllib.parse import urlparse
@@ -12,14 +10,8 @@ from urllib.parse import urlparse
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils.date_helpers import add_computed_fields  # noqa: E402
-from utils.holiday_helpers import (  # noqa: E402
-    get_holiday_name,
-    is_holiday,
-    parse_date_from_iso,
-    suggest_alternative_date,
-)
+from utils.date_helpers import add_computed_fields, compute_event_fields
+from utils.holiday_helpers import parse_date_from_iso, validate_booking_date
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +38,17 @@ class EventMetadata(TypedDict, total=False):
 # Default timezone constant
 DEFAULT_TIMEZONE = "America/Toronto"
 
+# English weekday names indexed by date.weekday(); independent of locale
+_WEEKDAY_NAMES = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
 # Metadata field length limits
 MAX_CHAT_TITLE_LENGTH = 200
 MAX_PROJECT_NAME_LENGTH = 100
@@ -265,10 +268,10 @@ class GoogleCalendarTools:
 
             # Check if start date is a holiday
             start_date = parse_date_from_iso(params["start_time"])
-            if is_holiday(start_date) and not force_holiday:
-                holiday_name = get_holiday_name(start_date)
-                alternative_date = suggest_alternative_date(start_date)
-
+            holiday_name, alternative_date = (
+                (None, None) if force_holiday else validate_booking_date(start_date)
+            )
+            if holiday_name:
                 error_msg = (
                     f"The requested date ({start_date}) is a holiday: {holiday_name}. "
                 )
@@ -276,7 +279,7 @@ class GoogleCalendarTools:
                 if alternative_date:
                     error_msg += (
                         f"Consider scheduling on {alternative_date} "
-                        f"({alternative_date.strftime('%A')}) instead. "
+                        f"({_WEEKDAY_NAMES[alternative_date.weekday()]}) instead. "
                     )
 
                 error_msg += (
@@ -590,9 +593,9 @@ class GoogleCalendarTools:
                     "attendees": event.get("attendees", []),
                 }
 
-                # Add computed fields for day-of-week and date information
+                # Add computed fields in place; formatted_event is already a fresh dict
                 try:
-                    formatted_event = add_computed_fields(formatted_event)
+                    formatted_event["computed"] = compute_event_fields(formatted_event)
                 except Exception as e:
                     logger.warning(
                         f"Failed to add computed fields to event {event.get('id', 'unknown')}: {e}"
@@ -1,13 +1,20 @@
 """Google Docs tools for MCP server."""
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 logger = logging.getLogger(__name__)
 
+# Field mask for the document fetch in update_document: only the text run
+# used to compute insert/delete positions is needed, not the full document.
+UPDATE_DOCUMENT_FIELDS = "body(content(paragraph(elements(textRun(content)))))"
+
+# Drive rejects batch requests with more than 100 calls
+MAX_BATCH_REQUESTS = 100
+
 
 class GoogleDocsTools:
     """Handles Google Docs operations."""
@@ -31,6 +38,44 @@ class GoogleDocsTools:
             self.drive_service = build("drive", "v3", credentials=creds)
         return self.drive_service
 
+    def _share_document(self, drive_service, document_id: str, emails: List[str]):
+        """Grant writer access to each email using batched Drive requests.
+
+        Emails are sent in batches of at most MAX_BATCH_REQUESTS. Failures for
+        individual users or whole batches are logged and do not abort the others.
+
+        Args:
+            drive_service: Google Drive service
+            document_id: Document ID to share
+            emails: Unique email addresses to share with
+        """
+
+        def _on_shared(request_id, response, exception):
+            if exception is not None:
+                logger.warning(f"Could not share with {request_id}: {exception}")
+            else:
+                logger.info(f"Shared document with: {request_id}")
+
+        for start in range(0, len(emails), MAX_BATCH_REQUESTS):
+            batch = drive_service.new_batch_http_request(callback=_on_shared)
+            for email in emails[start : start + MAX_BATCH_REQUESTS]:
+                batch.add(
+                    drive_service.permissions().create(
+                        fileId=document_id,
+                        body={
+                            "type": "user",
+                            "role": "writer",
+                            "emailAddress": email,
+                        },
+                    ),
+                    request_id=email,
+                )
+
+            try:
+                batch.execute()
+            except HttpError as e:
+                logger.warning(f"Could not share document {document_id}: {e}")
+
     def create_document(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new Google Doc.
 
@@ -48,7 +93,8 @@ class GoogleDocsTools:
             title = params["title"]
             content = params.get("content", "")
             folder_id = params.get("folder_id")
-            share_with = params.get("share_with", [])
+            # Batch request IDs must be unique, so drop repeated addresses
+            share_with = list(dict.fromkeys(params.get("share_with") or []))
 
             docs_service = self._get_docs_service()
             drive_service = self._get_drive_service()
@@ -94,21 +140,9 @@ class GoogleDocsTools:
                         f"Could not move document to folder {folder_id}: {e}"
                     )
 
-            # Share with users if specified
+            # Share with users if specified (batched round trips)
             if share_with:
-                for email in share_with:
-                    try:
-                        drive_service.permissions().create(
-                            fileId=document_id,
-                            body={
-                                "type": "user",
-                                "role": "writer",
-                                "emailAddress": email,
-                            },
-                        ).execute()
-                        logger.info(f"Shared document with: {email}")
-                    except HttpError as e:
-                        logger.warning(f"Could not share with {email}: {e}")
+                self._share_document(drive_service, document_id, share_with)
 
             # Get the document URL
             doc_url = f"https://docs.google.com/document/d/{document_id}/edit"
@@ -151,7 +185,11 @@ class GoogleDocsTools:
             docs_service = self._get_docs_service()
 
             # Get document to determine insert position
-            document = docs_service.documents().get(documentId=document_id).execute()
+            document = (
+                docs_service.documents()
+                .get(documentId=document_id, fields=UPDATE_DOCUMENT_FIELDS)
+                .execute()
+            )
 
             if replace_all:
                 # Replace all content
@@ -6,7 +6,8 @@ for enhancing calendar event responses with computed day-of-week and date inform
 
 import logging
 from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 logger = logging.getLogger(__name__)
@@ -206,6 +207,76 @@ def spans_multiple_days(start_dt: datetime, end_dt: datetime) -> bool:
         raise ValueError(f"Failed to check multiple days: {e}")
 
 
+@lru_cache(maxsize=4096)
+def _derive_datetime_fields(
+    datetime_str: str, timezone_str: Optional[str] = None
+) -> Tuple[datetime, str, str]:
+    """Parse a datetime string and derive its day name and date string.
+
+    Results are cached on the raw (datetime_str, timezone_str) pair, since
+    events in a listing frequently share start/end timestamps.
+
+    Args:
+        datetime_str: ISO format datetime string
+        timezone_str: Optional timezone string
+
+    Returns:
+        Tuple of (parsed datetime, day name, YYYY-MM-DD date string)
+
+    Raises:
+        ValueError: If the datetime cannot be parsed
+    """
+    dt = parse_calendar_datetime(datetime_str, timezone_str)
+    if dt is None:
+        raise ValueError("Failed to parse start or end datetime")
+    return dt, get_day_of_week(dt), get_date_string(dt)
+
+
+def compute_event_fields(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Compute day-of-week and date information for a calendar event.
+
+    Unlike add_computed_fields, this does not copy the event, so callers that
+    build a fresh event dict (e.g. list_events) can attach the result directly.
+
+    Args:
+        event: Calendar event dictionary with 'start' and 'end' fields
+
+    Returns:
+        Dictionary with startDay, endDay, startDate, endDate, duration
+        and spansMultipleDays
+
+    Raises:
+        ValueError: If event structure is invalid or datetime parsing fails
+    """
+    # Extract start datetime info
+    start_info = event["start"]
+    start_datetime_str = start_info.get("dateTime")
+    start_timezone = start_info.get("timeZone")
+
+    # Extract end datetime info
+    end_info = event["end"]
+    end_datetime_str = end_info.get("dateTime")
+    end_timezone = end_info.get("timeZone")
+
+    if not start_datetime_str or not end_datetime_str:
+        raise ValueError("start and end must have 'dateTime' fields")
+
+    # Parse datetimes and derive day/date strings (cached per timestamp)
+    start_dt, start_day, start_date = _derive_datetime_fields(
+        start_datetime_str, start_timezone
+    )
+    end_dt, end_day, end_date = _derive_datetime_fields(end_datetime_str, end_timezone)
+
+    return {
+        "startDay": start_day,
+        "endDay": end_day,
+        "startDate": start_date,
+        "endDate": end_date,
+        "duration": calculate_duration(start_dt, end_dt),
+        "spansMultipleDays": start_date != end_date,
+    }
+
+
 def add_computed_fields(event: Dict[str, Any]) -> Dict[str, Any]:
     """Add computed fields to a calendar event dictionary.
 
@@ -231,36 +302,7 @@ def add_computed_fields(event: Dict[str, Any]) -> Dict[str, Any]:
         raise ValueError("event must have 'start' and 'end' fields")
 
     try:
-        # Extract start datetime info
-        start_info = event["start"]
-        start_datetime_str = start_info.get("dateTime")
-        start_timezone = start_info.get("timeZone")
-
-        # Extract end datetime info
-        end_info = event["end"]
-        end_datetime_str = end_info.get("dateTime")
-        end_timezone = end_info.get("timeZone")
-
-        if not start_datetime_str or not end_datetime_str:
-            raise ValueError("start and end must have 'dateTime' fields")
-
-        # Parse datetimes
-        start_dt = parse_calendar_datetime(start_datetime_str, start_timezone)
-        end_dt = parse_calendar_datetime(end_datetime_str, end_timezone)
-
-        # Verify datetime parsing succeeded
-        if start_dt is None or end_dt is None:
-            raise ValueError("Failed to parse start or end datetime")
-
-        # Calculate computed fields
-        computed = {
-            "startDay": get_day_of_week(start_dt),
-            "endDay": get_day_of_week(end_dt),
-            "startDate": get_date_string(start_dt),
-            "endDate": get_date_string(end_dt),
-            "duration": calculate_duration(start_dt, end_dt),
-            "spansMultipleDays": spans_multiple_days(start_dt, end_dt),
-        }
+        computed = compute_event_fields(event)
 
         # Add computed fields to event (create copy to avoid mutation)
         enhanced_event = event.copy()
@@ -4,8 +4,9 @@ Provides holiday detection for US and Canadian calendars to support
 smart event scheduling that respects regional holidays.
 """
 
-from datetime import date, datetime, timedelta
-from typing import Optional, Tuple
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 from workalendar.america import Ontario
 from workalendar.usa import UnitedStates
@@ -15,6 +16,55 @@ _us_calendar = UnitedStates()
 _ca_calendar = Ontario()  # Using Ontario as representative Canadian calendar
 
 
+@lru_cache(maxsize=32)
+def _build_holiday_names(year: int) -> Dict[date, str]:
+    """Build the combined US/Canada holiday name table for one year.
+
+    Cached, so years outside _HOLIDAY_YEARS are only built on first use.
+
+    Args:
+        year: Calendar year
+
+    Returns:
+        Mapping of holiday date to display name, e.g.
+        "Christmas Day (US), Christmas Day (Canada)"
+    """
+    us_holidays: Dict[date, str] = {}
+    for d, name in _us_calendar.holidays(year):
+        if d.year == year:
+            us_holidays.setdefault(d, name)
+
+    ca_holidays: Dict[date, str] = {}
+    for d, name in _ca_calendar.holidays(year):
+        if d.year == year:
+            ca_holidays.setdefault(d, name)
+
+    names = {}
+    for d in us_holidays.keys() | ca_holidays.keys():
+        if d in us_holidays and d in ca_holidays:
+            names[d] = f"{us_holidays[d]} (US), {ca_holidays[d]} (Canada)"
+        elif d in us_holidays:
+            names[d] = f"{us_holidays[d]} (US)"
+        else:
+            names[d] = f"{ca_holidays[d]} (Canada)"
+    return names
+
+
+# Holiday names precomputed once for the years bookings usually fall in;
+# other years are built on demand and cached by _build_holiday_names
+_HOLIDAY_YEARS = range(date.today().year - 1, date.today().year + 6)
+_HOLIDAY_NAMES: Dict[date, str] = {
+    d: name for year in _HOLIDAY_YEARS for d, name in _build_holiday_names(year).items()
+}
+
+
+def _holiday_names_for(check_date: date) -> Dict[date, str]:
+    """Return the holiday name table covering check_date's year."""
+    if check_date.year in _HOLIDAY_YEARS:
+        return _HOLIDAY_NAMES
+    return _build_holiday_names(check_date.year)
+
+
 def is_holiday(check_date: date) -> bool:
     """Check if a date is a holiday in either US or Canada.
 
@@ -24,7 +74,7 @@ def is_holiday(check_date: date) -> bool:
     Returns:
         True if the date is a holiday in US or Canada, False otherwise
     """
-    return _us_calendar.is_holiday(check_date) or _ca_calendar.is_holiday(check_date)
+    return check_date in _holiday_names_for(check_date)
 
 
 def get_holiday_name(check_date: date) -> Optional[str]:
@@ -37,20 +87,7 @@ def get_holiday_name(check_date: date) -> Optional[str]:
         Holiday name if the date is a holiday, None otherwise.
         If the date is a holiday in both US and Canada, returns both names.
     """
-    us_holidays = [
-        name for d, name in _us_calendar.holidays(check_date.year) if d == check_date
-    ]
-    ca_holidays = [
-        name for d, name in _ca_calendar.holidays(check_date.year) if d == check_date
-    ]
-
-    if us_holidays and ca_holidays:
-        return f"{us_holidays[0]} (US), {ca_holidays[0]} (Canada)"
-    elif us_holidays:
-        return f"{us_holidays[0]} (US)"
-    elif ca_holidays:
-        return f"{ca_holidays[0]} (Canada)"
-    return None
+    return _holiday_names_for(check_date).get(check_date)
 
 
 def is_working_day(check_date: date) -> bool:
@@ -62,12 +99,68 @@ def is_working_day(check_date: date) -> bool:
     Returns:
         True if the date is a working day, False if weekend or holiday
     """
+    return _is_working_ordinal(check_date.toordinal())
+
+
+def _weekday_of(ordinal: int) -> int:
+    """Return the weekday (Monday=0) of a proleptic ordinal; day 1 is a Monday."""
+    return (ordinal + 6) % 7
+
+
+def _compute_is_working(ordinal: int) -> bool:
+    """Check if the date with the given proleptic ordinal is a working day."""
     # Check if it's a weekend (Saturday=5, Sunday=6)
-    if check_date.weekday() in (5, 6):
+    if _weekday_of(ordinal) >= 5:
         return False
 
     # Check if it's a holiday
-    return not is_holiday(check_date)
+    return not is_holiday(date.fromordinal(ordinal))
+
+
+# One byte per day across _HOLIDAY_YEARS (1 = working day), indexed by
+# ordinal - _WORKDAY_EPOCH, so next-working-day scans run as bytes.find()
+_WORKDAY_EPOCH = date(_HOLIDAY_YEARS[0], 1, 1).toordinal()
+_WORKDAY_FLAGS = bytes(
+    _compute_is_working(ordinal)
+    for ordinal in range(_WORKDAY_EPOCH, date(_HOLIDAY_YEARS[-1] + 1, 1, 1).toordinal())
+)
+
+
+@lru_cache(maxsize=8192)
+def _is_working_ordinal(ordinal: int) -> bool:
+    """Check if the date with the given proleptic ordinal is a working day."""
+    index = ordinal - _WORKDAY_EPOCH
+    if 0 <= index < len(_WORKDAY_FLAGS):
+        return _WORKDAY_FLAGS[index] == 1
+    return _compute_is_working(ordinal)
+
+
+@lru_cache(maxsize=4096)
+def _next_working_ordinal(start_ordinal: int, max_days_ahead: int) -> Optional[int]:
+    """Find the ordinal of the first working day within max_days_ahead days.
+
+    Returns:
+        Ordinal of the next working day, or None if there is none in range
+    """
+    start_index = start_ordinal - _WORKDAY_EPOCH
+    end_index = start_index + max_days_ahead + 1
+    if start_index >= 0 and end_index <= len(_WORKDAY_FLAGS):
+        index = _WORKDAY_FLAGS.find(1, start_index, end_index)
+        return None if index < 0 else _WORKDAY_EPOCH + index
+
+    # Outside the table: jump over weekends arithmetically and only check
+    # weekdays against the holiday calendar
+    ordinal = start_ordinal
+    last_ordinal = start_ordinal + max_days_ahead
+    while ordinal <= last_ordinal:
+        weekday = _weekday_of(ordinal)
+        if weekday >= 5:
+            ordinal += 7 - weekday
+        elif _is_working_ordinal(ordinal):
+            return ordinal
+        else:
+            ordinal += 1
+    return None
 
 
 def find_next_working_day(
@@ -85,19 +178,15 @@ def find_next_working_day(
     Raises:
         ValueError: If no working day found within max_days_ahead
     """
-    current_date = start_date
-    days_checked = 0
-
-    while days_checked <= max_days_ahead:
-        if is_working_day(current_date):
-            return current_date, days_checked
+    start_ordinal = start_date.toordinal()
+    next_ordinal = _next_working_ordinal(start_ordinal, max_days_ahead)
 
-        current_date += timedelta(days=1)
-        days_checked += 1
+    if next_ordinal is None:
+        raise ValueError(
+            f"No working day found within {max_days_ahead} days of {start_date}"
+        )
 
-    raise ValueError(
-        f"No working day found within {max_days_ahead} days of {start_date}"
-    )
+    return date.fromordinal(next_ordinal), next_ordinal - start_ordinal
 
 
 def suggest_alternative_date(requested_date: date) -> Optional[date]:
@@ -119,6 +208,57 @@ def suggest_alternative_date(requested_date: date) -> Optional[date]:
         return None
 
 
+def validate_booking_date(
+    requested_date: date,
+) -> Tuple[Optional[str], Optional[date]]:
+    """Check a requested booking date in one pass.
+
+    Combines get_holiday_name() and suggest_alternative_date() so callers
+    that need both do a single holiday lookup.
+
+    Args:
+        requested_date: The date requested by the user
+
+    Returns:
+        Tuple of (holiday_name, alternative_date). Both are None if the date
+        is not a holiday; alternative_date is None if no working day is found
+    """
+    holiday_name = get_holiday_name(requested_date)
+    if holiday_name is None:
+        return None, None
+
+    try:
+        next_working_day, _ = find_next_working_day(requested_date)
+    except ValueError:
+        return holiday_name, None
+    return holiday_name, next_working_day
+
+
+def try_parse_date_from_iso(iso_string: str) -> Optional[date]:
+    """Parse a date from ISO format string (YYYY-MM-DD), or return None.
+
+    Args:
+        iso_string: ISO format date string
+
+    Returns:
+        Parsed date object, or None if the string cannot be parsed
+    """
+    try:
+        # Timestamps need a single full parse; the time part does not shift the date
+        if "T" in iso_string:
+            return datetime.fromisoformat(iso_string.replace("Z", "+00:00")).date()
+        # Fast path for zero-padded date-only strings; strptime covers the rest
+        # (e.g. non-padded "2025-1-1")
+        if len(iso_string) >= 10 and iso_string[4] == "-" and iso_string[7] == "-":
+            try:
+                return date.fromisoformat(iso_string[:10])
+            except ValueError:
+                pass
+        return datetime.strptime(iso_string[:10], "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
 def parse_date_from_iso(iso_string: str) -> date:
     """Parse a date from ISO format string (YYYY-MM-DD).
 
@@ -131,12 +271,7 @@ def parse_date_from_iso(iso_string: str) -> date:
     Raises:
         ValueError: If the string cannot be parsed
     """
-    try:
-        # Handle datetime strings (ISO 8601 with time)
-        if "T" in iso_string:
-            dt = datetime.fromisoformat(iso_string.replace("Z", "+00:00"))
-            return dt.date()
-        # Handle date-only strings
-        return datetime.strptime(iso_string[:10], "%Y-%m-%d").date()
-    except (ValueError, IndexError) as e:
-        raise ValueError(f"Invalid ISO date string: {iso_string}") from e
+    parsed = try_parse_date_from_iso(iso_string)
+    if parsed is None:
+        raise ValueError(f"Invalid ISO date string: {iso_string}")
+    return parsed
@@ -2,6 +2,7 @@
 
 import json
 import logging
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
@@ -13,7 +14,11 @@ class ScopeManager:
 
     def __init__(self, config_path: str = "config/scopes.json"):
         self.config_path = Path(config_path)
-        self.config = self._load_config()
+
+    @cached_property
+    def config(self) -> Dict:
+        """Scope configuration, loaded from config_path on first access."""
+        return self._load_config()
 
     def _load_config(self) -> Dict:
         """Load scope configuration from file."""
@@ -0,0 +1,17 @@
+"""Shared pytest fixtures."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from tools.calendar import GoogleCalendarTools
+
+
+@pytest.fixture
+def calendar_tools():
+    """Create GoogleCalendarTools with a stub auth manager.
+
+    Nothing inspects the auth manager's calls; tests that reach the API patch
+    tools.calendar.build.
+    """
+    return GoogleCalendarTools(SimpleNamespace(get_credentials=object))
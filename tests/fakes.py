@@ -0,0 +1,35 @@
+"""Lightweight fakes for the googleapiclient request objects used in tests."""
+
+
+class FakeRequest:
+    """Stand-in for an HttpRequest whose execute() returns or raises a preset value."""
+
+    def __init__(self, response, kwargs=None):
+        self._response = response
+        self.kwargs = kwargs or {}
+
+    def execute(self):
+        if isinstance(self._response, Exception):
+            raise self._response
+        return self._response
+
+
+class FakeMethod:
+    """Fake API method that records call kwargs and returns a FakeRequest.
+
+    Tests set ``response`` and read the recorded kwargs from ``calls``;
+    ``reset()`` restores the original response and clears the calls.
+    """
+
+    def __init__(self, response):
+        self.default = response
+        self.response = response
+        self.calls = []
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        return FakeRequest(self.response, kwargs)
+
+    def reset(self):
+        self.response = self.default
+        self.calls.clear()
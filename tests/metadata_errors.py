@@ -0,0 +1,10 @@
+"""Error patterns raised by GoogleCalendarTools metadata validation.
+
+Used with pytest.raises(match=...) by the metadata and update_event tests.
+"""
+
+import re
+
+ISO_DATE_ERROR = re.compile(r"created_date must be in ISO format \(YYYY-MM-DD\)")
+HTTPS_ERROR = re.compile(r"chat_url must use HTTPS protocol")
+DOMAIN_ERROR = re.compile(r"chat_url must be from claude\.ai domain")
@@ -1,11 +1,16 @@
 """Integration tests for enhanced calendar functionality with computed fields."""
 
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
+from googleapiclient.errors import HttpError
 
 from tools.calendar import GoogleCalendarTools
 
+# Opaque credentials handed to the (patched) build(); no mock behaviour needed
+_SENTINEL_CREDS = object()
+
 
 class TestEnhancedCalendar:
     """Tests for enhanced calendar functionality with computed fields."""
@@ -13,179 +18,107 @@ class TestEnhancedCalendar:
     def setup_method(self):
         """Set up test fixtures."""
         self.mock_auth_manager = Mock()
+        self.mock_auth_manager.get_credentials.return_value = _SENTINEL_CREDS
         self.calendar_tools = GoogleCalendarTools(self.mock_auth_manager)
 
+        # Build the events() resource once so tests configure it directly
+        # instead of re-walking mock_service.events().<method>() chains.
+        self.events_api = Mock()
+        self.mock_service = Mock()
+        self.mock_service.events.return_value = self.events_api
+
+    @pytest.mark.parametrize(
+        "operation,start,end,expected",
+        [
+            (
+                "list",
+                "2025-09-27T12:30:00-04:00",
+                "2025-09-27T13:00:00-04:00",
+                {
+                    "startDay": "Saturday",  # 2025-09-27 is Saturday
+                    "endDay": "Saturday",
+                    "startDate": "2025-09-27",
+                    "endDate": "2025-09-27",
+                    "duration": "30 minutes",
+                    "spansMultipleDays": False,
+                },
+            ),
+            (
+                "create",
+                "2025-09-28T14:00:00-04:00",
+                "2025-09-28T15:30:00-04:00",
+                {
+                    "startDay": "Sunday",  # 2025-09-28 is Sunday
+                    "endDay": "Sunday",
+                    "startDate": "2025-09-28",
+                    "endDate": "2025-09-28",
+                    "duration": "1 hour 30 minutes",
+                    "spansMultipleDays": False,
+                },
+            ),
+            (
+                "list",
+                "2025-09-27T09:00:00-04:00",  # Saturday
+                "2025-09-29T17:00:00-04:00",  # Monday
+                {
+                    "startDay": "Saturday",
+                    "endDay": "Monday",
+                    "startDate": "2025-09-27",
+                    "endDate": "2025-09-29",
+                    "duration": "2 days 8 hours",
+                    "spansMultipleDays": True,
+                },
+            ),
+        ],
+        ids=["list_events", "create_event", "multi_day"],
+    )
     @patch("tools.calendar.build")
-    @pytest.mark.asyncio
-    async def test_list_events_with_computed_fields(self, mock_build):
-        """Test that list_events includes computed fields in response."""
-        # Mock Google Calendar service response
-        mock_service = Mock()
-        mock_build.return_value = mock_service
+    def test_computed_fields(self, mock_build, operation, start, end, expected):
+        """Test that list_events and create_event include computed fields."""
+        mock_build.return_value = self.mock_service
 
         # Mock calendar event from Google API
         mock_event = {
             "id": "test-event-id",
             "summary": "Test Event",
-            "start": {
-                "dateTime": "2025-09-27T12:30:00-04:00",
-                "timeZone": "America/Toronto",
-            },
-            "end": {
-                "dateTime": "2025-09-27T13:00:00-04:00",
-                "timeZone": "America/Toronto",
-            },
+            "start": {"dateTime": start, "timeZone": "America/Toronto"},
+            "end": {"dateTime": end, "timeZone": "America/Toronto"},
             "location": "Test Location",
             "description": "Test Description",
             "htmlLink": "https://calendar.google.com/test",
             "status": "confirmed",
             "attendees": [],
+            "created": "2025-09-25T10:00:00Z",
         }
 
-        mock_service.events().list().execute.return_value = {"items": [mock_event]}
-
-        # Mock authentication
-        self.mock_auth_manager.get_credentials.return_value = Mock()
-
-        # Call list_events
-        result = self.calendar_tools.list_events({})
-
-        # Verify basic response structure
-        assert "events" in result
-        assert "count" in result
-        assert result["count"] == 1
-
-        # Verify computed fields are added
-        event = result["events"][0]
-        assert "computed" in event
-
-        computed = event["computed"]
-        assert "startDay" in computed
-        assert "endDay" in computed
-        assert "startDate" in computed
-        assert "endDate" in computed
-        assert "duration" in computed
-        assert "spansMultipleDays" in computed
-
-        # Verify specific computed values
-        assert computed["startDay"] == "Saturday"  # 2025-09-27 is Saturday
-        assert computed["endDay"] == "Saturday"
-        assert computed["startDate"] == "2025-09-27"
-        assert computed["endDate"] == "2025-09-27"
-        assert computed["duration"] == "30 minutes"
-        assert computed["spansMultipleDays"] is False
+        self.events_api.list.return_value.execute.return_value = {"items": [mock_event]}
+        self.events_api.insert.return_value.execute.return_value = mock_event
+
+        if operation == "list":
+            result = self.calendar_tools.list_events({})
+            assert result["count"] == 1
+            event = result["events"][0]
+            assert event["location"] == "Test Location"
+        else:
+            event = self.calendar_tools.create_event(
+                {
+                    "summary": "Test Event",
+                    "start_time": start,
+                    "end_time": end,
+                    "timezone": "America/Toronto",
+                }
+            )
+
+        assert event["computed"] == expected
 
         # Verify original fields are preserved
         assert event["id"] == "test-event-id"
         assert event["summary"] == "Test Event"
-        assert event["location"] == "Test Location"
-
-    @patch("tools.calendar.build")
-    @pytest.mark.asyncio
-    async def test_create_event_with_computed_fields(self, mock_build):
-        """Test that create_event includes computed fields in response."""
-        # Mock Google Calendar service response
-        mock_service = Mock()
-        mock_build.return_value = mock_service
-
-        # Mock created event response from Google API
-        mock_created_event = {
-            "id": "new-event-id",
-            "summary": "New Event",
-            "start": {
-                "dateTime": "2025-09-28T14:00:00-04:00",
-                "timeZone": "America/Toronto",
-            },
-            "end": {
-                "dateTime": "2025-09-28T15:30:00-04:00",
-                "timeZone": "America/Toronto",
-            },
-            "htmlLink": "https://calendar.google.com/new-event",
-            "status": "confirmed",
-            "created": "2025-09-25T10:00:00Z",
-        }
-
-        mock_service.events().insert().execute.return_value = mock_created_event
-
-        # Mock authentication
-        self.mock_auth_manager.get_credentials.return_value = Mock()
-
-        # Create event parameters
-        params = {
-            "summary": "New Event",
-            "start_time": "2025-09-28T14:00:00-04:00",
-            "end_time": "2025-09-28T15:30:00-04:00",
-            "timezone": "America/Toronto",
-        }
-
-        # Call create_event
-        result = self.calendar_tools.create_event(params)
-
-        # Verify computed fields are added
-        assert "computed" in result
-
-        computed = result["computed"]
-        assert computed["startDay"] == "Sunday"  # 2025-09-28 is Sunday
-        assert computed["endDay"] == "Sunday"
-        assert computed["startDate"] == "2025-09-28"
-        assert computed["endDate"] == "2025-09-28"
-        assert computed["duration"] == "1 hour 30 minutes"
-        assert computed["spansMultipleDays"] is False
-
-        # Verify original fields are preserved
-        assert result["id"] == "new-event-id"
-        assert result["summary"] == "New Event"
 
     @patch("tools.calendar.build")
-    @pytest.mark.asyncio
-    async def test_multi_day_event_computed_fields(self, mock_build):
-        """Test computed fields for multi-day events."""
-        # Mock Google Calendar service response
-        mock_service = Mock()
-        mock_build.return_value = mock_service
-
-        # Mock multi-day event
-        mock_event = {
-            "id": "multi-day-event",
-            "summary": "Conference",
-            "start": {
-                "dateTime": "2025-09-27T09:00:00-04:00",  # Saturday
-                "timeZone": "America/Toronto",
-            },
-            "end": {
-                "dateTime": "2025-09-29T17:00:00-04:00",  # Monday
-                "timeZone": "America/Toronto",
-            },
-            "location": "Convention Center",
-            "htmlLink": "https://calendar.google.com/conference",
-            "status": "confirmed",
-        }
-
-        mock_service.events().list().execute.return_value = {"items": [mock_event]}
-
-        # Mock authentication
-        self.mock_auth_manager.get_credentials.return_value = Mock()
-
-        # Call list_events
-        result = self.calendar_tools.list_events({})
-
-        # Verify computed fields for multi-day event
-        event = result["events"][0]
-        computed = event["computed"]
-
-        assert computed["startDay"] == "Saturday"
-        assert computed["endDay"] == "Monday"
-        assert computed["startDate"] == "2025-09-27"
-        assert computed["endDate"] == "2025-09-29"
-        assert computed["spansMultipleDays"] is True
-        assert "days" in computed["duration"]  # Should include days in duration
-
-    @patch("tools.calendar.build")
-    @pytest.mark.asyncio
-    async def test_update_event_basic(self, mock_build):
+    def test_update_event_basic(self, mock_build):
         """Test updating a calendar event."""
-        mock_service = Mock()
-        mock_build.return_value = mock_service
+        mock_build.return_value = self.mock_service
 
         # Mock existing event
         existing_event = {
@@ -218,10 +151,8 @@ class TestEnhancedCalendar:
             "updated": "2025-09-25T10:30:00Z",
         }
 
-        mock_service.events().get().execute.return_value = existing_event
-        mock_service.events().update().execute.return_value = updated_event
-
-        self.mock_auth_manager.get_credentials.return_value = Mock()
+        self.events_api.get.return_value.execute.return_value = existing_event
+        self.events_api.update.return_value.execute.return_value = updated_event
 
         params = {
             "calendar_id": "primary",
@@ -236,11 +167,9 @@ class TestEnhancedCalendar:
         assert "computed" in result
 
     @patch("tools.calendar.build")
-    @pytest.mark.asyncio
-    async def test_update_event_with_time_change(self, mock_build):
+    def test_update_event_with_time_change(self, mock_build):
         """Test updating event with time changes."""
-        mock_service = Mock()
-        mock_build.return_value = mock_service
+        mock_build.return_value = self.mock_service
 
         existing_event = {
             "id": "event-456",
@@ -271,10 +200,8 @@ class TestEnhancedCalendar:
             "updated": "2025-09-25T11:00:00Z",
         }
 
-        mock_service.events().get().execute.return_value = existing_event
-        mock_service.events().update().execute.return_value = updated_event
-
-        self.mock_auth_manager.get_credentials.return_value = Mock()
+        self.events_api.get.return_value.execute.return_value = existing_event
+        self.events_api.update.return_value.execute.return_value = updated_event
 
         params = {
             "calendar_id": "primary",
@@ -289,11 +216,9 @@ class TestEnhancedCalendar:
         assert result["start"]["dateTime"] == "2025-09-28T14:00:00-04:00"
 
     @patch("tools.calendar.build")
-    @pytest.mark.asyncio
-    async def test_update_event_with_attendees(self, mock_build):
+    def test_update_event_with_attendees(self, mock_build):
         """Test updating event with attendees."""
-        mock_service = Mock()
-        mock_build.return_value = mock_service
+        mock_build.return_value = self.mock_service
 
         existing_event = {
             "id": "event-789",
@@ -328,10 +253,8 @@ class TestEnhancedCalendar:
             "updated": "2025-09-25T12:00:00Z",
         }
 
-        mock_service.events().get().execute.return_value = existing_event
-        mock_service.events().update().execute.return_value = updated_event
-
-        self.mock_auth_manager.get_credentials.return_value = Mock()
+        self.events_api.get.return_value.execute.return_value = existing_event
+        self.events_api.update.return_value.execute.return_value = updated_event
 
         params = {
             "calendar_id": "primary",
@@ -345,40 +268,31 @@ class TestEnhancedCalendar:
         assert "computed" in result
 
     @patch("tools.calendar.build")
-    @pytest.mark.asyncio
-    async def test_delete_event_success(self, mock_build):
+    def test_delete_event_success(self, mock_build):
         """Test deleting a calendar event."""
-        mock_service = Mock()
-        mock_build.return_value = mock_service
-
-        mock_service.events().delete().execute.return_value = None
+        mock_build.return_value = self.mock_service
 
-        self.mock_auth_manager.get_credentials.return_value = Mock()
+        self.events_api.delete.return_value.execute.return_value = None
 
         params = {"calendar_id": "primary", "event_id": "event-to-delete"}
 
         result = self.calendar_tools.delete_event(params)
 
-        assert result["success"] is True
-        assert "deleted successfully" in result["message"]
-        assert "event-to-delete" in result["message"]
+        assert result == {
+            "success": True,
+            "message": "Event event-to-delete deleted successfully",
+        }
 
     @patch("tools.calendar.build")
-    @pytest.mark.asyncio
-    async def test_update_event_error_handling(self, mock_build):
+    def test_update_event_error_handling(self, mock_build):
         """Test error handling when updating event."""
-        from googleapiclient.errors import HttpError
-
-        mock_service = Mock()
-        mock_build.return_value = mock_service
+        mock_build.return_value = self.mock_service
 
         # Mock HTTP error
-        mock_service.events().get().execute.side_effect = HttpError(
-            resp=Mock(status=404), content=b"Not Found"
+        self.events_api.get.return_value.execute.side_effect = HttpError(
+            resp=SimpleNamespace(status=404, reason="Not Found"), content=b"Not Found"
         )
 
-        self.mock_auth_manager.get_credentials.return_value = Mock()
-
         params = {
             "calendar_id": "primary",
             "event_id": "nonexistent",
@@ -389,32 +303,24 @@ class TestEnhancedCalendar:
             self.calendar_tools.update_event(params)
 
     @patch("tools.calendar.build")
-    @pytest.mark.asyncio
-    async def test_delete_event_error_handling(self, mock_build):
+    def test_delete_event_error_handling(self, mock_build):
         """Test error handling when deleting event."""
-        from googleapiclient.errors import HttpError
-
-        mock_service = Mock()
-        mock_build.return_value = mock_service
+        mock_build.return_value = self.mock_service
 
         # Mock HTTP error
-        mock_service.events().delete().execute.side_effect = HttpError(
-            resp=Mock(status=403), content=b"Forbidden"
+        self.events_api.delete.return_value.execute.side_effect = HttpError(
+            resp=SimpleNamespace(status=403, reason="Forbidden"), content=b"Forbidden"
         )
 
-        self.mock_auth_manager.get_credentials.return_value = Mock()
-
         params = {"calendar_id": "primary", "event_id": "forbidden-event"}
 
         with pytest.raises(HttpError):
             self.calendar_tools.delete_event(params)
 
     @patch("tools.calendar.build")
-    @pytest.mark.asyncio
-    async def test_create_event_with_metadata(self, mock_build):
+    def test_create_event_with_metadata(self, mock_build):
         """Test creating event with metadata appended to description."""
-        mock_service = Mock()
-        mock_build.return_value = mock_service
+        mock_build.return_value = self.mock_service
 
         mock_created_event = {
             "id": "event-with-metadata",
@@ -438,9 +344,7 @@ class TestEnhancedCalendar:
             "created": "2025-09-28T10:00:00Z",
         }
 
-        mock_service.events().insert().execute.return_value = mock_created_event
-        self.mock_auth_manager.get_credentials.return_value = Mock()
-
+        self.events_api.insert.return_value.execute.return_value = mock_created_event
         params = {
             "summary": "Team Meeting",
             "start_time": "2025-09-28T14:00:00-04:00",
@@ -460,20 +364,19 @@ class TestEnhancedCalendar:
         assert "computed" in result
 
         # Verify the event was created with metadata in description
-        call_args = mock_service.events().insert.call_args
+        call_args = self.events_api.insert.call_args
         event_body = call_args.kwargs["body"]
-        assert "📋 Context:" in event_body["description"]
-        assert "Created: 2025-09-28" in event_body["description"]
-        assert "Project: Q4 Planning" in event_body["description"]
-        assert "Chat: Team Sync Discussion" in event_body["description"]
-        assert "URL: https://claude.ai/chat/abc123" in event_body["description"]
+        assert event_body["description"] == (
+            "Discuss project updates\n\n---\n📋 Context:\n"
+            "Created: 2025-09-28\nProject: Q4 Planning\n"
+            "Chat: Team Sync Discussion\n"
+            "URL: https://claude.ai/chat/abc123"
+        )
 
     @patch("tools.calendar.build")
-    @pytest.mark.asyncio
-    async def test_create_event_with_partial_metadata(self, mock_build):
+    def test_create_event_with_partial_metadata(self, mock_build):
         """Test creating event with partial metadata."""
-        mock_service = Mock()
-        mock_build.return_value = mock_service
+        mock_build.return_value = self.mock_service
 
         mock_created_event = {
             "id": "event-partial-meta",
@@ -492,9 +395,7 @@ class TestEnhancedCalendar:
             "created": "2025-09-29T09:00:00Z",
         }
 
-        mock_service.events().insert().execute.return_value = mock_created_event
-        self.mock_auth_manager.get_credentials.return_value = Mock()
-
+        self.events_api.insert.return_value.execute.return_value = mock_created_event
         params = {
             "summary": "Quick Task",
             "start_time": "2025-09-29T10:00:00-04:00",
@@ -511,12 +412,11 @@ class TestEnhancedCalendar:
         assert result["id"] == "event-partial-meta"
 
         # Verify only chat_title was added
-        call_args = mock_service.events().insert.call_args
+        call_args = self.events_api.insert.call_args
         event_body = call_args.kwargs["body"]
-        assert "📋 Context:" in event_body["description"]
-        assert "Chat: Daily Planning" in event_body["description"]
-        assert "Project:" not in event_body["description"]
-        assert "Created:" not in event_body["description"]
+        assert event_body["description"] == (
+            "Task notes\n\n---\n📋 Context:\nChat: Daily Planning"
+        )
 
 
 if __name__ == "__main__":
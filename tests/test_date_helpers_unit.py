@@ -6,8 +6,10 @@ from zoneinfo import ZoneInfo
 import pytest
 
 from utils.date_helpers import (
+    _derive_datetime_fields,
     add_computed_fields,
     calculate_duration,
+    compute_event_fields,
     get_date_string,
     get_day_of_week,
     parse_calendar_datetime,
@@ -242,14 +244,14 @@ class TestAddComputedFields:
 
         result = add_computed_fields(event)
 
-        assert "computed" in result
-        computed = result["computed"]
-        assert computed["startDay"] == "Saturday"
-        assert computed["endDay"] == "Saturday"
-        assert computed["startDate"] == "2025-09-27"
-        assert computed["endDate"] == "2025-09-27"
-        assert computed["duration"] == "30 minutes"
-        assert computed["spansMultipleDays"] is False
+        assert result["computed"] == {
+            "startDay": "Saturday",
+            "endDay": "Saturday",
+            "startDate": "2025-09-27",
+            "endDate": "2025-09-27",
+            "duration": "30 minutes",
+            "spansMultipleDays": False,
+        }
 
     def test_add_computed_fields_multi_day_event(self):
         """Test computed fields for multi-day event."""
@@ -267,14 +269,14 @@ class TestAddComputedFields:
         }
 
         result = add_computed_fields(event)
-        computed = result["computed"]
-
-        assert computed["startDay"] == "Saturday"
-        assert computed["endDay"] == "Monday"
-        assert computed["startDate"] == "2025-09-27"
-        assert computed["endDate"] == "2025-09-29"
-        assert computed["spansMultipleDays"] is True
-        assert "days" in computed["duration"]
+        assert result["computed"] == {
+            "startDay": "Saturday",
+            "endDay": "Monday",
+            "startDate": "2025-09-27",
+            "endDate": "2025-09-29",
+            "duration": "2 days 8 hours",
+            "spansMultipleDays": True,
+        }
 
     def test_add_computed_fields_preserves_original(self):
         """Test that original event data is preserved."""
@@ -362,6 +364,48 @@ class TestAddComputedFields:
         assert computed["endDay"] == "Saturday"
         assert computed["duration"] == "30 minutes"
 
+    def test_add_computed_fields_reuses_cached_derivation(self):
+        """Test that repeated timestamps are parsed only once."""
+        _derive_datetime_fields.cache_clear()
+        event = {
+            "id": "cached-event",
+            "start": {
+                "dateTime": "2025-09-27T12:30:00-04:00",
+                "timeZone": "America/Toronto",
+            },
+            "end": {
+                "dateTime": "2025-09-27T13:00:00-04:00",
+                "timeZone": "America/Toronto",
+            },
+        }
+
+        first = add_computed_fields(event)
+        second = add_computed_fields(event)
+
+        assert first["computed"] == second["computed"]
+        info = _derive_datetime_fields.cache_info()
+        assert info.misses == 2
+        assert info.hits == 2
+
+    def test_compute_event_fields_does_not_copy_event(self):
+        """Test that compute_event_fields returns only the computed dict."""
+        event = {
+            "start": {"dateTime": "2025-09-27T16:30:00Z"},
+            "end": {"dateTime": "2025-09-28T17:00:00Z"},
+        }
+
+        computed = compute_event_fields(event)
+
+        assert "computed" not in event
+        assert computed == {
+            "startDay": "Saturday",
+            "endDay": "Sunday",
+            "startDate": "2025-09-27",
+            "endDate": "2025-09-28",
+            "duration": "1 day 30 minutes",
+            "spansMultipleDays": True,
+        }
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
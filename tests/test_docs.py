@@ -1,17 +1,127 @@
 """Tests for Google Docs tools."""
 
-from unittest.mock import MagicMock, Mock, patch
+import logging
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import create_autospec, patch
 
 import pytest
-
-from tools.docs import GoogleDocsTools
+from googleapiclient.errors import HttpError
+
+from auth.google_auth import GoogleAuthManager
+from fakes import FakeMethod
+from tools.docs import MAX_BATCH_REQUESTS, GoogleDocsTools
+
+# Read-only API responses shared by the create_document tests
+_DOC_RESPONSE = MappingProxyType(
+    {"documentId": "test-doc-id", "title": "Test Document", "revisionId": "rev-123"}
+)
+_FILE_RESPONSE = MappingProxyType({"parents": ("root",)})
+_PERMISSION_RESPONSE = MappingProxyType(
+    {"id": "permission-id", "type": "user", "role": "writer"}
+)
+
+# HTTP errors raised by the error-handling tests
+_HTTP_403 = HttpError(
+    resp=SimpleNamespace(status=403, reason="Forbidden"), content=b"Forbidden"
+)
+_HTTP_404 = HttpError(
+    resp=SimpleNamespace(status=404, reason="Not Found"), content=b"Not Found"
+)
+
+# Existing document returned by documents().get() in the update_document tests;
+# its single text run is 17 characters long
+_EXISTING_DOC = MappingProxyType(
+    {
+        "documentId": "doc-123",
+        "body": {
+            "content": [
+                {
+                    "paragraph": {
+                        "elements": [{"textRun": {"content": "Existing content\n"}}]
+                    }
+                }
+            ]
+        },
+    }
+)
+
+
+class _FakeBatch:
+    """Stand-in for a BatchHttpRequest that runs queued requests on execute()."""
+
+    def __init__(self, callback=None):
+        self._callback = callback
+        self.requests = []
+
+    def add(self, request, callback=None, request_id=None):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self.requests:
+            try:
+                response, exception = request.execute(), None
+            except HttpError as e:
+                response, exception = None, e
+            self._callback(request_id, response, exception)
+
+
+def make_fake_docs_service(create_resp=None, batch_resp=None, get_resp=None):
+    """Create a lightweight Docs service fake exposing documents()."""
+    documents = SimpleNamespace(
+        create=FakeMethod(create_resp),
+        batchUpdate=FakeMethod(batch_resp),
+        get=FakeMethod(get_resp),
+    )
+
+    def reset():
+        for method in vars(documents).values():
+            method.reset()
+
+    return SimpleNamespace(documents=lambda: documents, reset=reset)
+
+
+def make_fake_drive_service(get_resp=None, update_resp=None, permission_resp=None):
+    """Create a lightweight Drive service fake exposing files() and permissions()."""
+    files = SimpleNamespace(get=FakeMethod(get_resp), update=FakeMethod(update_resp))
+    permissions = SimpleNamespace(create=FakeMethod(permission_resp))
+    batches = []
+
+    def new_batch_http_request(callback=None):
+        batch = _FakeBatch(callback)
+        batches.append(batch)
+        return batch
+
+    def reset():
+        for method in (*vars(files).values(), *vars(permissions).values()):
+            method.reset()
+        batches.clear()
+
+    return SimpleNamespace(
+        files=lambda: files,
+        permissions=lambda: permissions,
+        new_batch_http_request=new_batch_http_request,
+        batches=batches,
+        reset=reset,
+    )
+
+
+# Service fakes built once and shared; the mock_build fixture resets them
+_DOCS_SERVICE_TEMPLATE = make_fake_docs_service(
+    create_resp=_DOC_RESPONSE, batch_resp={}
+)
+_DRIVE_SERVICE_TEMPLATE = make_fake_drive_service(
+    get_resp=_FILE_RESPONSE,
+    update_resp=MappingProxyType({"id": "test-doc-id"}),
+    permission_resp=_PERMISSION_RESPONSE,
+)
+_SERVICES = {"docs": _DOCS_SERVICE_TEMPLATE, "drive": _DRIVE_SERVICE_TEMPLATE}
 
 
 @pytest.fixture
 def mock_auth_manager():
-    """Create a mock auth manager."""
-    auth_manager = Mock()
-    auth_manager.get_credentials.return_value = Mock()
+    """Create an autospecced auth manager."""
+    auth_manager = create_autospec(GoogleAuthManager, instance=True)
+    auth_manager.get_credentials.return_value = object()
     return auth_manager
 
 
@@ -21,276 +131,230 @@ def docs_tools(mock_auth_manager):
     return GoogleDocsTools(mock_auth_manager)
 
 
-class TestGoogleDocsTools:
-    """Test cases for Google Docs tools."""
+@pytest.fixture(autouse=True)
+def mock_build():
+    """Patch tools.docs.build to hand out the shared service templates."""
+    with patch("tools.docs.build") as build:
+        # build(serviceName, version, credentials=...) dispatches on the name
+        build.side_effect = lambda name, *_, **__: _SERVICES[name]
+        yield build
+    _DOCS_SERVICE_TEMPLATE.reset()
+    _DRIVE_SERVICE_TEMPLATE.reset()
 
-    @pytest.mark.asyncio
-    @patch("tools.docs.build")
-    async def test_create_document_basic(self, mock_build, docs_tools):
-        """Test creating a basic document."""
-        # Setup mocks
-        mock_docs_service = MagicMock()
-        mock_drive_service = MagicMock()
-        mock_build.side_effect = [mock_docs_service, mock_drive_service]
-
-        # Mock document creation response
-        mock_doc_response = {
-            "documentId": "test-doc-id",
-            "title": "Test Document",
-            "revisionId": "rev-123",
-        }
-        mock_docs_service.documents().create().execute.return_value = mock_doc_response
 
-        # Test parameters
-        params = {"title": "Test Document"}
+class TestGoogleDocsTools:
+    """Test cases for Google Docs tools."""
 
+    @pytest.mark.parametrize(
+        "params,expected",
+        [
+            ({"title": "Test Document"}, {}),
+            ({"title": "Test Document", "content": "This is test content"}, {}),
+            (
+                {"title": "Test Document", "folder_id": "folder-123"},
+                {"folder_id": "folder-123"},
+            ),
+            (
+                {
+                    "title": "Test Document",
+                    "share_with": ["user1@example.com", "user2@example.com"],
+                },
+                {"shared_with": ["user1@example.com", "user2@example.com"]},
+            ),
+            ({"title": "Test Document", "share_with": None}, {}),
+        ],
+        ids=["basic", "with_content", "with_folder", "with_sharing", "share_with_none"],
+    )
+    def test_create_document(self, docs_tools, params, expected):
+        """Test creating a document with optional content, folder and sharing."""
         # Execute
         result = docs_tools.create_document(params)
 
-        # Verify basic functionality
-        assert result["documentId"] == "test-doc-id"
-        assert result["title"] == "Test Document"
-        assert result["url"] == "https://docs.google.com/document/d/test-doc-id/edit"
-        assert result["revisionId"] == "rev-123"
-
-    @pytest.mark.asyncio
-    @patch("tools.docs.build")
-    async def test_create_document_with_content(self, mock_build, docs_tools):
-        """Test creating a document with initial content."""
-        # Setup mocks
-        mock_docs_service = MagicMock()
-        mock_drive_service = MagicMock()
-        mock_build.side_effect = [mock_docs_service, mock_drive_service]
-
-        # Mock responses
-        mock_doc_response = {
+        # Verify
+        assert result == {
             "documentId": "test-doc-id",
             "title": "Test Document",
+            "url": "https://docs.google.com/document/d/test-doc-id/edit",
             "revisionId": "rev-123",
+            "shared_with": [],
+            "folder_id": None,
+            **expected,
         }
-        mock_docs_service.documents().create().execute.return_value = mock_doc_response
-        mock_docs_service.documents().batchUpdate().execute.return_value = {}
 
-        # Test parameters
-        params = {"title": "Test Document", "content": "This is test content"}
+    @pytest.mark.parametrize(
+        "permission_resp,warnings",
+        [
+            (_PERMISSION_RESPONSE, []),
+            (
+                _HTTP_403,
+                [
+                    "Could not share with user1@example.com",
+                    "Could not share with user2@example.com",
+                ],
+            ),
+        ],
+        ids=["success", "permission_error"],
+    )
+    def test_create_document_shares_in_single_batch(
+        self, docs_tools, caplog, permission_resp, warnings
+    ):
+        """Test that sharing sends every permission in one batch request."""
+        mock_drive_service = _DRIVE_SERVICE_TEMPLATE
+        mock_drive_service.permissions().create.response = permission_resp
 
-        # Execute
-        result = docs_tools.create_document(params)
-
-        # Verify
-        assert result["documentId"] == "test-doc-id"
-        assert result["title"] == "Test Document"
-
-    @pytest.mark.asyncio
-    @patch("tools.docs.build")
-    async def test_create_document_with_folder(self, mock_build, docs_tools):
-        """Test creating a document in a specific folder."""
-        # Setup mocks
-        mock_docs_service = MagicMock()
-        mock_drive_service = MagicMock()
-        mock_build.side_effect = [mock_docs_service, mock_drive_service]
-
-        # Mock responses
-        mock_doc_response = {
-            "documentId": "test-doc-id",
+        params = {
             "title": "Test Document",
-            "revisionId": "rev-123",
+            "share_with": ["user1@example.com", "user2@example.com"],
         }
-        mock_docs_service.documents().create().execute.return_value = mock_doc_response
-
-        mock_file_response = {"parents": ["root"]}
-        mock_drive_service.files().get().execute.return_value = mock_file_response
-        mock_drive_service.files().update().execute.return_value = {"id": "test-doc-id"}
 
-        # Test parameters
-        params = {"title": "Test Document", "folder_id": "folder-123"}
+        # Per-user failures are logged, not raised
+        with caplog.at_level(logging.WARNING, logger="tools.docs"):
+            result = docs_tools.create_document(params)
 
-        # Execute
-        result = docs_tools.create_document(params)
+        assert result["shared_with"] == ["user1@example.com", "user2@example.com"]
+        assert len(mock_drive_service.batches) == 1
+        batch = mock_drive_service.batches[0]
+        assert [request_id for request_id, _ in batch.requests] == [
+            "user1@example.com",
+            "user2@example.com",
+        ]
+        assert [
+            request.kwargs["body"]["emailAddress"] for _, request in batch.requests
+        ] == [
+            "user1@example.com",
+            "user2@example.com",
+        ]
+        assert [record.getMessage().split(":")[0] for record in caplog.records] == (
+            warnings
+        )
 
-        # Verify
-        assert result["documentId"] == "test-doc-id"
-        assert result["folder_id"] == "folder-123"
-
-    @pytest.mark.asyncio
-    @patch("tools.docs.build")
-    async def test_create_document_with_sharing(self, mock_build, docs_tools):
-        """Test creating a document and sharing it."""
-        # Setup mocks
-        mock_docs_service = MagicMock()
-        mock_drive_service = MagicMock()
-        mock_build.side_effect = [mock_docs_service, mock_drive_service]
-
-        # Mock document creation response
-        mock_doc_response = {
-            "documentId": "test-doc-id",
-            "title": "Test Document",
-            "revisionId": "rev-123",
-        }
-        mock_docs_service.documents().create().execute.return_value = mock_doc_response
+    def test_create_document_splits_sharing_into_batches(self, docs_tools):
+        """Test that more than MAX_BATCH_REQUESTS recipients use several batches."""
+        emails = [f"user{i}@example.com" for i in range(2 * MAX_BATCH_REQUESTS + 1)]
 
-        # Mock sharing response
-        mock_permission_response = {
-            "id": "permission-id",
-            "type": "user",
-            "role": "writer",
-        }
-        mock_drive_service.permissions().create().execute.return_value = (
-            mock_permission_response
+        result = docs_tools.create_document(
+            {"title": "Test Document", "share_with": emails}
         )
 
-        # Test parameters
+        assert result["shared_with"] == emails
+        batches = _DRIVE_SERVICE_TEMPLATE.batches
+        assert [len(batch.requests) for batch in batches] == [
+            MAX_BATCH_REQUESTS,
+            MAX_BATCH_REQUESTS,
+            1,
+        ]
+        assert [
+            request_id for batch in batches for request_id, _ in batch.requests
+        ] == emails
+
+    def test_create_document_deduplicates_share_with(self, docs_tools):
+        """Test that repeated addresses are shared once and returned once."""
         params = {
             "title": "Test Document",
-            "share_with": ["user1@example.com", "user2@example.com"],
+            "share_with": [
+                "user1@example.com",
+                "user2@example.com",
+                "user1@example.com",
+            ],
         }
 
-        # Execute
         result = docs_tools.create_document(params)
 
-        # Verify basic functionality
-        assert result["documentId"] == "test-doc-id"
         assert result["shared_with"] == ["user1@example.com", "user2@example.com"]
+        (batch,) = _DRIVE_SERVICE_TEMPLATE.batches
+        assert [request_id for request_id, _ in batch.requests] == [
+            "user1@example.com",
+            "user2@example.com",
+        ]
 
-    @pytest.mark.asyncio
-    @patch("tools.docs.build")
-    async def test_update_document_append(self, mock_build, docs_tools):
-        """Test updating a document by appending content."""
-        mock_docs_service = MagicMock()
-        mock_build.return_value = mock_docs_service
-
-        # Mock existing document
-        mock_doc = {
-            "documentId": "doc-123",
-            "body": {
-                "content": [
-                    {
-                        "paragraph": {
-                            "elements": [{"textRun": {"content": "Existing content\n"}}]
-                        }
-                    }
-                ]
-            },
-        }
-        mock_docs_service.documents().get().execute.return_value = mock_doc
-
-        mock_update_response = {
-            "documentId": "doc-123",
-            "replies": [],
-            "writeControl": {},
-        }
-        mock_docs_service.documents().batchUpdate().execute.return_value = (
-            mock_update_response
-        )
-
-        params = {"document_id": "doc-123", "content": "New content"}
+    def test_create_document_logs_failed_share_batch(
+        self, docs_tools, caplog, monkeypatch
+    ):
+        """Test that an HttpError from batch.execute() is logged, not raised."""
 
-        result = docs_tools.update_document(params)
+        def fail(batch):
+            raise _HTTP_403
 
-        assert result["documentId"] == "doc-123"
-        assert "replies" in result
+        monkeypatch.setattr(_FakeBatch, "execute", fail)
+        params = {"title": "Test Document", "share_with": ["user1@example.com"]}
 
-    @pytest.mark.asyncio
-    @patch("tools.docs.build")
-    async def test_update_document_at_index(self, mock_build, docs_tools):
-        """Test updating a document at specific index."""
-        mock_docs_service = MagicMock()
-        mock_build.return_value = mock_docs_service
+        with caplog.at_level(logging.WARNING, logger="tools.docs"):
+            result = docs_tools.create_document(params)
 
-        mock_doc = {
-            "documentId": "doc-456",
-            "body": {
-                "content": [
+        assert result["documentId"] == "test-doc-id"
+        assert [record.getMessage().split(":")[0] for record in caplog.records] == [
+            "Could not share document test-doc-id"
+        ]
+
+    @pytest.mark.parametrize(
+        "params,expected_requests",
+        [
+            (
+                {"document_id": "doc-123", "content": "New content"},
+                [{"insertText": {"location": {"index": 16}, "text": "New content"}}],
+            ),
+            (
+                {"document_id": "doc-456", "content": "Inserted text", "index": 5},
+                [{"insertText": {"location": {"index": 5}, "text": "Inserted text"}}],
+            ),
+            (
+                {
+                    "document_id": "doc-789",
+                    "content": "Completely new content",
+                    "replace_all": True,
+                },
+                [
                     {
-                        "paragraph": {
-                            "elements": [{"textRun": {"content": "Existing content\n"}}]
+                        "deleteContentRange": {
+                            "range": {"startIndex": 1, "endIndex": 17}
                         }
-                    }
-                ]
-            },
-        }
-        mock_docs_service.documents().get().execute.return_value = mock_doc
-
-        mock_update_response = {"documentId": "doc-456", "replies": []}
-        mock_docs_service.documents().batchUpdate().execute.return_value = (
-            mock_update_response
-        )
-
-        params = {"document_id": "doc-456", "content": "Inserted text", "index": 5}
-
-        result = docs_tools.update_document(params)
-
-        assert result["documentId"] == "doc-456"
-
-    @pytest.mark.asyncio
-    @patch("tools.docs.build")
-    async def test_update_document_replace_all(self, mock_build, docs_tools):
-        """Test replacing all document content."""
-        mock_docs_service = MagicMock()
-        mock_build.return_value = mock_docs_service
-
-        mock_doc = {
-            "documentId": "doc-789",
-            "body": {
-                "content": [
+                    },
                     {
-                        "paragraph": {
-                            "elements": [{"textRun": {"content": "Old content\n"}}]
+                        "insertText": {
+                            "location": {"index": 1},
+                            "text": "Completely new content",
                         }
-                    }
-                ]
-            },
-        }
-        mock_docs_service.documents().get().execute.return_value = mock_doc
-
-        mock_update_response = {"documentId": "doc-789", "replies": []}
-        mock_docs_service.documents().batchUpdate().execute.return_value = (
-            mock_update_response
-        )
-
-        params = {
-            "document_id": "doc-789",
-            "content": "Completely new content",
-            "replace_all": True,
-        }
+                    },
+                ],
+            ),
+        ],
+        ids=["append", "at_index", "replace_all"],
+    )
+    def test_update_document(self, docs_tools, params, expected_requests):
+        """Test appending, inserting at an index and replacing document content."""
+        documents = _DOCS_SERVICE_TEMPLATE.documents()
+        documents.get.response = _EXISTING_DOC
+        documents.batchUpdate.response = {"replies": [], "writeControl": {}}
 
         result = docs_tools.update_document(params)
 
-        assert result["documentId"] == "doc-789"
-        assert "replies" in result
-
-    @pytest.mark.asyncio
-    @patch("tools.docs.build")
-    async def test_create_document_error_handling(self, mock_build, docs_tools):
+        document_id = params["document_id"]
+        assert result == {"documentId": document_id, "replies": [], "writeControl": {}}
+        # The mask must keep the text runs update_document reads for its indexes
+        assert documents.get.calls == [
+            {
+                "documentId": document_id,
+                "fields": "body(content(paragraph(elements(textRun(content)))))",
+            }
+        ]
+        assert documents.batchUpdate.calls == [
+            {"documentId": document_id, "body": {"requests": expected_requests}}
+        ]
+
+    def test_create_document_error_handling(self, docs_tools):
         """Test error handling when creating document."""
-        from googleapiclient.errors import HttpError
-
-        mock_docs_service = MagicMock()
-        mock_build.return_value = mock_docs_service
-
         # Mock HTTP error
-        mock_docs_service.documents().create().execute.side_effect = HttpError(
-            resp=Mock(status=403), content=b"Forbidden"
-        )
+        _DOCS_SERVICE_TEMPLATE.documents().create.response = _HTTP_403
 
         params = {"title": "Test Document"}
 
         with pytest.raises(HttpError):
             docs_tools.create_document(params)
 
-    @pytest.mark.asyncio
-    @patch("tools.docs.build")
-    async def test_update_document_error_handling(self, mock_build, docs_tools):
+    def test_update_document_error_handling(self, docs_tools):
         """Test error handling when updating document."""
-        from googleapiclient.errors import HttpError
-
-        mock_docs_service = MagicMock()
-        mock_build.return_value = mock_docs_service
-
         # Mock HTTP error on get
-        mock_docs_service.documents().get().execute.side_effect = HttpError(
-            resp=Mock(status=404), content=b"Not Found"
-        )
+        _DOCS_SERVICE_TEMPLATE.documents().get.response = _HTTP_404
 
         params = {"document_id": "nonexistent", "content": "New content"}
 
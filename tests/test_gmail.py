@@ -1,18 +1,55 @@
 """Tests for Gmail tools."""
 
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, create_autospec, patch
 
 import pytest
+from googleapiclient.errors import HttpError
 
+from auth.google_auth import GoogleAuthManager
+from fakes import FakeMethod
 from tools.gmail import GmailTools
 
+# Autospecced auth mock built once at import; the mock_auth_manager fixture
+# clears its call records for each test
+_PROTOTYPE_AUTH = create_autospec(GoogleAuthManager, instance=True)
+_PROTOTYPE_AUTH.get_credentials.return_value = object()
+
+# HTTP errors raised by the error-handling tests
+_HTTP_400 = HttpError(
+    resp=SimpleNamespace(status=400, reason="Bad Request"), content=b"Bad Request"
+)
+_HTTP_403 = HttpError(
+    resp=SimpleNamespace(status=403, reason="Forbidden"), content=b"Forbidden"
+)
+_HTTP_500 = HttpError(
+    resp=SimpleNamespace(status=500, reason="Internal Server Error"),
+    content=b"Internal Server Error",
+)
+
+
+def make_fake_gmail_service(send=None, list_=None, get=None, draft=None, labels=None):
+    """Create a lightweight Gmail service fake exposing users().
+
+    Each argument is the response (or exception) for the matching
+    users().messages()/drafts()/labels() method.
+    """
+    messages = SimpleNamespace(
+        send=FakeMethod(send), list=FakeMethod(list_), get=FakeMethod(get)
+    )
+    drafts = SimpleNamespace(create=FakeMethod(draft))
+    labels_ = SimpleNamespace(list=FakeMethod(labels))
+    users = SimpleNamespace(
+        messages=lambda: messages, drafts=lambda: drafts, labels=lambda: labels_
+    )
+    return SimpleNamespace(users=lambda: users)
+
 
 @pytest.fixture
 def mock_auth_manager():
-    """Create a mock auth manager."""
-    auth_manager = Mock()
-    auth_manager.get_credentials.return_value = Mock()
-    return auth_manager
+    """Return the shared autospecced auth manager with its calls cleared."""
+    _PROTOTYPE_AUTH.reset_mock()
+    return _PROTOTYPE_AUTH
 
 
 @pytest.fixture
@@ -39,6 +76,13 @@ def gmail_tools(mock_auth_manager):
     return GmailTools(mock_auth_manager)
 
 
+@pytest.fixture(autouse=True)
+def mock_build():
+    """Patch tools.gmail.build; tests set return_value to a fake service."""
+    with patch("tools.gmail.build") as build:
+        yield build
+
+
 @pytest.fixture
 def gmail_tools_with_scope(mock_auth_manager, mock_scope_manager):
     """Create GmailTools instance with scope manager."""
@@ -54,21 +98,15 @@ def gmail_tools_restricted(mock_auth_manager, mock_scope_manager_with_restrictio
 class TestGmailTools:
     """Test cases for Gmail tools."""
 
-    @pytest.mark.asyncio
-    @patch("tools.gmail.build")
-    async def test_send_email_basic(self, mock_build, gmail_tools):
+    def test_send_email_basic(self, mock_build, gmail_tools):
         """Test sending a basic email."""
-        # Setup mocks
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
         # Mock send response
         mock_send_response = {
             "id": "msg-123",
             "threadId": "thread-123",
             "labelIds": ["SENT"],
         }
-        mock_service.users().messages().send().execute.return_value = mock_send_response
+        mock_build.return_value = make_fake_gmail_service(send=mock_send_response)
 
         # Test parameters
         params = {
@@ -84,15 +122,10 @@ class TestGmailTools:
         assert result["id"] == "msg-123"
         assert result["threadId"] == "thread-123"
 
-    @pytest.mark.asyncio
-    @patch("tools.gmail.build")
-    async def test_send_email_with_cc_bcc(self, mock_build, gmail_tools):
+    def test_send_email_with_cc_bcc(self, mock_build, gmail_tools):
         """Test sending email with CC and BCC."""
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
         mock_send_response = {"id": "msg-123", "threadId": "thread-123"}
-        mock_service.users().messages().send().execute.return_value = mock_send_response
+        mock_build.return_value = make_fake_gmail_service(send=mock_send_response)
 
         params = {
             "to": "test@example.com",
@@ -105,15 +138,10 @@ class TestGmailTools:
         result = gmail_tools.send_email(params)
         assert result["id"] == "msg-123"
 
-    @pytest.mark.asyncio
-    @patch("tools.gmail.build")
-    async def test_send_email_html(self, mock_build, gmail_tools):
+    def test_send_email_html(self, mock_build, gmail_tools):
         """Test sending HTML email."""
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
         mock_send_response = {"id": "msg-123"}
-        mock_service.users().messages().send().execute.return_value = mock_send_response
+        mock_build.return_value = make_fake_gmail_service(send=mock_send_response)
 
         params = {
             "to": "test@example.com",
@@ -125,13 +153,8 @@ class TestGmailTools:
         result = gmail_tools.send_email(params)
         assert result["id"] == "msg-123"
 
-    @pytest.mark.asyncio
-    @patch("tools.gmail.build")
-    async def test_search_emails_basic(self, mock_build, gmail_tools):
+    def test_search_emails_basic(self, mock_build, gmail_tools):
         """Test searching emails."""
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
         # Mock search results
         mock_list_response = {
             "messages": [
@@ -139,7 +162,6 @@ class TestGmailTools:
                 {"id": "msg2", "threadId": "thread2"},
             ]
         }
-        mock_service.users().messages().list().execute.return_value = mock_list_response
 
         # Mock get message responses
         mock_message_1 = {
@@ -154,7 +176,9 @@ class TestGmailTools:
             },
             "snippet": "Message snippet 1",
         }
-        mock_service.users().messages().get().execute.return_value = mock_message_1
+        mock_build.return_value = make_fake_gmail_service(
+            list_=mock_list_response, get=mock_message_1
+        )
 
         params = {"query": "from:sender@example.com", "max_results": 10}
 
@@ -163,15 +187,9 @@ class TestGmailTools:
         assert "messages" in result
         assert len(result["messages"]) == 2
 
-    @pytest.mark.asyncio
-    @patch("tools.gmail.build")
-    async def test_search_emails_with_body(self, mock_build, gmail_tools):
+    def test_search_emails_with_body(self, mock_build, gmail_tools):
         """Test searching emails with body included."""
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
         mock_list_response = {"messages": [{"id": "msg1", "threadId": "thread1"}]}
-        mock_service.users().messages().list().execute.return_value = mock_list_response
 
         mock_message = {
             "id": "msg1",
@@ -186,27 +204,22 @@ class TestGmailTools:
             },
             "snippet": "snippet",
         }
-        mock_service.users().messages().get().execute.return_value = mock_message
+        mock_build.return_value = make_fake_gmail_service(
+            list_=mock_list_response, get=mock_message
+        )
 
         params = {"query": "test", "include_body": True}
 
         result = gmail_tools.search_emails(params)
         assert len(result["messages"]) == 1
 
-    @pytest.mark.asyncio
-    @patch("tools.gmail.build")
-    async def test_create_draft_basic(self, mock_build, gmail_tools):
+    def test_create_draft_basic(self, mock_build, gmail_tools):
         """Test creating email draft."""
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
         mock_draft_response = {
             "id": "draft-123",
             "message": {"id": "msg-123", "threadId": "thread-123"},
         }
-        mock_service.users().drafts().create().execute.return_value = (
-            mock_draft_response
-        )
+        mock_build.return_value = make_fake_gmail_service(draft=mock_draft_response)
 
         params = {
             "to": "test@example.com",
@@ -219,17 +232,10 @@ class TestGmailTools:
         assert result["id"] == "draft-123"
         assert result["message"]["id"] == "msg-123"
 
-    @pytest.mark.asyncio
-    @patch("tools.gmail.build")
-    async def test_create_draft_with_cc_bcc(self, mock_build, gmail_tools):
+    def test_create_draft_with_cc_bcc(self, mock_build, gmail_tools):
         """Test creating draft with CC and BCC."""
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
         mock_draft_response = {"id": "draft-123", "message": {"id": "msg-123"}}
-        mock_service.users().drafts().create().execute.return_value = (
-            mock_draft_response
-        )
+        mock_build.return_value = make_fake_gmail_service(draft=mock_draft_response)
 
         params = {
             "to": ["to1@example.com", "to2@example.com"],
@@ -242,84 +248,42 @@ class TestGmailTools:
         result = gmail_tools.create_draft(params)
         assert result["id"] == "draft-123"
 
-    @pytest.mark.asyncio
-    @patch("tools.gmail.build")
-    async def test_send_email_error_handling(self, mock_build, gmail_tools):
-        """Test error handling when sending email."""
-        from googleapiclient.errors import HttpError
-
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
-        # Mock HTTP error
-        mock_service.users().messages().send().execute.side_effect = HttpError(
-            resp=Mock(status=400), content=b"Bad Request"
-        )
-
-        params = {
-            "to": "test@example.com",
-            "subject": "Test",
-            "body": "Body",
-        }
-
-        with pytest.raises(HttpError):
-            gmail_tools.send_email(params)
-
-    @pytest.mark.asyncio
-    @patch("tools.gmail.build")
-    async def test_search_emails_error_handling(self, mock_build, gmail_tools):
-        """Test error handling when searching emails."""
-        from googleapiclient.errors import HttpError
-
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
-        # Mock HTTP error
-        mock_service.users().messages().list().execute.side_effect = HttpError(
-            resp=Mock(status=403), content=b"Forbidden"
-        )
-
-        params = {"query": "test"}
-
-        with pytest.raises(HttpError):
-            gmail_tools.search_emails(params)
-
-    @pytest.mark.asyncio
-    @patch("tools.gmail.build")
-    async def test_create_draft_error_handling(self, mock_build, gmail_tools):
-        """Test error handling when creating draft."""
-        from googleapiclient.errors import HttpError
-
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
-        # Mock HTTP error
-        mock_service.users().drafts().create().execute.side_effect = HttpError(
-            resp=Mock(status=500), content=b"Internal Server Error"
-        )
-
-        params = {
-            "to": "test@example.com",
-            "subject": "Test",
-            "body": "Body",
-        }
+    @pytest.mark.parametrize(
+        "method_name,service_kwargs,params",
+        [
+            (
+                "send_email",
+                {"send": _HTTP_400},
+                {"to": "test@example.com", "subject": "Test", "body": "Body"},
+            ),
+            (
+                "search_emails",
+                {"list_": _HTTP_403},
+                {"query": "test"},
+            ),
+            (
+                "create_draft",
+                {"draft": _HTTP_500},
+                {"to": "test@example.com", "subject": "Test", "body": "Body"},
+            ),
+        ],
+        ids=["send_email", "search_emails", "create_draft"],
+    )
+    def test_error_handling(
+        self, mock_build, gmail_tools, method_name, service_kwargs, params
+    ):
+        """Test that HTTP errors from the Gmail API are re-raised."""
+        mock_build.return_value = make_fake_gmail_service(**service_kwargs)
 
         with pytest.raises(HttpError):
-            gmail_tools.create_draft(params)
+            getattr(gmail_tools, method_name)(params)
 
 
 class TestGmailLabelFiltering:
     """Test cases for Gmail label-based access restriction."""
 
-    @pytest.mark.asyncio
-    @patch("tools.gmail.build")
-    async def test_label_initialization_success(
-        self, mock_build, gmail_tools_restricted
-    ):
+    def test_label_initialization_success(self, mock_build, gmail_tools_restricted):
         """Test successful label resolution."""
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
         # Mock labels.list() response
         mock_labels_response = {
             "labels": [
@@ -328,11 +292,12 @@ class TestGmailLabelFiltering:
                 {"id": "INBOX", "name": "INBOX"},
             ]
         }
-        mock_service.users().labels().list().execute.return_value = mock_labels_response
 
         # Mock search response
         mock_list_response = {"messages": []}
-        mock_service.users().messages().list().execute.return_value = mock_list_response
+        mock_build.return_value = make_fake_gmail_service(
+            labels=mock_labels_response, list_=mock_list_response
+        )
 
         # Execute search to trigger label initialization
         gmail_tools_restricted.search_emails({"query": "test"})
@@ -341,13 +306,8 @@ class TestGmailLabelFiltering:
         assert gmail_tools_restricted._restricted_label_ids == ["Label_1"]
         assert gmail_tools_restricted._label_initialized is True
 
-    @pytest.mark.asyncio
-    @patch("tools.gmail.build")
-    async def test_label_not_found_error(self, mock_build, gmail_tools_restricted):
+    def test_label_not_found_error(self, mock_build, gmail_tools_restricted):
         """Test error when configured label doesn't exist."""
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
         # Mock labels.list() response without "Jobs" label
         mock_labels_response = {
             "labels": [
@@ -355,7 +315,7 @@ class TestGmailLabelFiltering:
                 {"id": "INBOX", "name": "INBOX"},
             ]
         }
-        mock_service.users().labels().list().execute.return_value = mock_labels_response
+        mock_build.return_value = make_fake_gmail_service(labels=mock_labels_response)
 
         # Execute search to trigger label initialization
         with pytest.raises(ValueError) as exc_info:
@@ -364,16 +324,12 @@ class TestGmailLabelFiltering:
         assert "Configured Gmail label 'Jobs' not found" in str(exc_info.value)
         assert "Available labels:" in str(exc_info.value)
 
-    @pytest.mark.asyncio
-    @patch("tools.gmail.build")
-    async def test_no_restriction_configured(self, mock_build, gmail_tools_with_scope):
+    def test_no_restriction_configured(self, mock_build, gmail_tools_with_scope):
         """Test normal operation when no restriction is configured."""
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
         # Mock search response
         mock_list_response = {"messages": []}
-        mock_service.users().messages().list().execute.return_value = mock_list_response
+        mock_service = make_fake_gmail_service(list_=mock_list_response)
+        mock_build.return_value = mock_service
 
         # Execute search
         gmail_tools_with_scope.search_emails({"query": "test"})
@@ -383,86 +339,74 @@ class TestGmailLabelFiltering:
         assert gmail_tools_with_scope._label_initialized is True
 
         # Verify query passed through unchanged
-        call_args = mock_service.users().messages().list.call_args
-        assert call_args[1]["q"] == "test"
+        assert mock_service.users().messages().list.calls[-1]["q"] == "test"
 
-    @pytest.mark.asyncio
-    @patch("tools.gmail.build")
-    async def test_label_caching(self, mock_build, gmail_tools_restricted):
+    def test_label_caching(self, mock_build, gmail_tools_restricted):
         """Test that labels are cached and not fetched repeatedly."""
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
         # Mock labels.list() response
         mock_labels_response = {
             "labels": [
                 {"id": "Label_1", "name": "Jobs"},
             ]
         }
-        mock_service.users().labels().list().execute.return_value = mock_labels_response
 
         # Mock search response
         mock_list_response = {"messages": []}
-        mock_service.users().messages().list().execute.return_value = mock_list_response
+        mock_service = make_fake_gmail_service(
+            labels=mock_labels_response, list_=mock_list_response
+        )
+        mock_build.return_value = mock_service
 
         # Execute search twice
         gmail_tools_restricted.search_emails({"query": "test1"})
         gmail_tools_restricted.search_emails({"query": "test2"})
 
         # Verify labels.list() was called only once
-        assert mock_service.users().labels().list().execute.call_count == 1
+        assert len(mock_service.users().labels().list.calls) == 1
 
-    @pytest.mark.asyncio
-    @patch("tools.gmail.build")
-    async def test_search_query_enhancement_with_restriction(
+    def test_search_query_enhancement_with_restriction(
         self, mock_build, gmail_tools_restricted
     ):
         """Test that search query is enhanced with label filter."""
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
         # Mock labels.list() response
         mock_labels_response = {"labels": [{"id": "Label_1", "name": "Jobs"}]}
-        mock_service.users().labels().list().execute.return_value = mock_labels_response
 
         # Mock search response
         mock_list_response = {"messages": []}
-        mock_service.users().messages().list().execute.return_value = mock_list_response
+        mock_service = make_fake_gmail_service(
+            labels=mock_labels_response, list_=mock_list_response
+        )
+        mock_build.return_value = mock_service
 
         # Execute search with query
         gmail_tools_restricted.search_emails({"query": "from:example@example.com"})
 
         # Verify query was enhanced with label filter
-        call_args = mock_service.users().messages().list.call_args
-        assert call_args[1]["q"] == 'from:example@example.com label:"Jobs"'
+        call_kwargs = mock_service.users().messages().list.calls[-1]
+        assert call_kwargs["q"] == 'from:example@example.com label:"Jobs"'
 
-    @pytest.mark.asyncio
-    @patch("tools.gmail.build")
-    async def test_search_empty_query_becomes_label_filter(
+    def test_search_empty_query_becomes_label_filter(
         self, mock_build, gmail_tools_restricted
     ):
         """Test that empty query becomes just the label filter."""
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
         # Mock labels.list() response
         mock_labels_response = {"labels": [{"id": "Label_1", "name": "Jobs"}]}
-        mock_service.users().labels().list().execute.return_value = mock_labels_response
 
         # Mock search response
         mock_list_response = {"messages": []}
-        mock_service.users().messages().list().execute.return_value = mock_list_response
+        mock_service = make_fake_gmail_service(
+            labels=mock_labels_response, list_=mock_list_response
+        )
+        mock_build.return_value = mock_service
 
         # Execute search with empty query
         gmail_tools_restricted.search_emails({"query": ""})
 
         # Verify query is just the label filter
-        call_args = mock_service.users().messages().list.call_args
-        assert call_args[1]["q"] == 'label:"Jobs"'
+        call_kwargs = mock_service.users().messages().list.calls[-1]
+        assert call_kwargs["q"] == 'label:"Jobs"'
 
-    @pytest.mark.asyncio
-    @patch("tools.gmail.build")
-    async def test_multiple_labels_ored_and_quoted(self, mock_build, mock_auth_manager):
+    def test_multiple_labels_ored_and_quoted(self, mock_build, mock_auth_manager):
         """Multiple restricted labels are resolved, OR-ed, and quoted."""
         scope_manager = Mock()
         scope_manager.get_restricted_labels.return_value = [
@@ -472,9 +416,6 @@ class TestGmailLabelFiltering:
         ]
         gmail = GmailTools(mock_auth_manager, scope_manager)
 
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
         mock_labels_response = {
             "labels": [
                 {"id": "Label_1", "name": "Jobs"},
@@ -483,30 +424,27 @@ class TestGmailLabelFiltering:
                 {"id": "Label_4", "name": "Personal"},
             ]
         }
-        mock_service.users().labels().list().execute.return_value = mock_labels_response
-        mock_service.users().messages().list().execute.return_value = {"messages": []}
+        mock_service = make_fake_gmail_service(
+            labels=mock_labels_response, list_={"messages": []}
+        )
+        mock_build.return_value = mock_service
 
         gmail.search_emails({"query": "is:unread"})
 
         assert gmail._restricted_label_ids == ["Label_1", "Label_2", "Label_3"]
-        call_args = mock_service.users().messages().list.call_args
+        call_kwargs = mock_service.users().messages().list.calls[-1]
         assert (
-            call_args[1]["q"]
+            call_kwargs["q"]
             == 'is:unread (label:"Jobs" OR label:"_News Feed" OR label:"AI")'
         )
 
-    @pytest.mark.asyncio
-    @patch("tools.gmail.build")
-    async def test_send_email_blocked_with_restriction(
+    def test_send_email_blocked_with_restriction(
         self, mock_build, gmail_tools_restricted
     ):
         """Test that send_email is blocked when restriction is enabled."""
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
         # Mock labels.list() response
         mock_labels_response = {"labels": [{"id": "Label_1", "name": "Jobs"}]}
-        mock_service.users().labels().list().execute.return_value = mock_labels_response
+        mock_build.return_value = make_fake_gmail_service(labels=mock_labels_response)
 
         params = {
             "to": "test@example.com",
@@ -522,18 +460,13 @@ class TestGmailLabelFiltering:
             exc_info.value
         )
 
-    @pytest.mark.asyncio
-    @patch("tools.gmail.build")
-    async def test_create_draft_blocked_with_restriction(
+    def test_create_draft_blocked_with_restriction(
         self, mock_build, gmail_tools_restricted
     ):
         """Test that create_draft is blocked when restriction is enabled."""
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
         # Mock labels.list() response
         mock_labels_response = {"labels": [{"id": "Label_1", "name": "Jobs"}]}
-        mock_service.users().labels().list().execute.return_value = mock_labels_response
+        mock_build.return_value = make_fake_gmail_service(labels=mock_labels_response)
 
         params = {
             "to": "test@example.com",
@@ -549,21 +482,16 @@ class TestGmailLabelFiltering:
             exc_info.value
         )
 
-    @pytest.mark.asyncio
-    @patch("tools.gmail.build")
-    async def test_send_email_allowed_without_restriction(
+    def test_send_email_allowed_without_restriction(
         self, mock_build, gmail_tools_with_scope
     ):
         """Test that send_email works when no restriction is configured."""
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
         mock_send_response = {
             "id": "msg-123",
             "threadId": "thread-123",
             "labelIds": ["SENT"],
         }
-        mock_service.users().messages().send().execute.return_value = mock_send_response
+        mock_build.return_value = make_fake_gmail_service(send=mock_send_response)
 
         params = {
             "to": "test@example.com",
@@ -577,22 +505,15 @@ class TestGmailLabelFiltering:
         # Should succeed
         assert result["id"] == "msg-123"
 
-    @pytest.mark.asyncio
-    @patch("tools.gmail.build")
-    async def test_create_draft_allowed_without_restriction(
+    def test_create_draft_allowed_without_restriction(
         self, mock_build, gmail_tools_with_scope
     ):
         """Test that create_draft works when no restriction is configured."""
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-
         mock_draft_response = {
             "id": "draft-123",
             "message": {"id": "msg-123", "threadId": "thread-123"},
         }
-        mock_service.users().drafts().create().execute.return_value = (
-            mock_draft_response
-        )
+        mock_build.return_value = make_fake_gmail_service(draft=mock_draft_response)
 
         params = {
             "to": "test@example.com",
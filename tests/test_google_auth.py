@@ -1,153 +1,191 @@
 """Tests for Google authentication."""
 
+import copy
 import json
-import os
-import tempfile
 from pathlib import Path
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
+from google.oauth2.credentials import Credentials
 
 from auth.google_auth import GoogleAuthManager
 
+# Default ScopeManager behaviour for the scope_manager fixture: a valid
+# calendar-only configuration with no scope changes since the last token
+_SCOPE_MANAGER_CONFIG = {
+    "validate_configuration.return_value": (True, []),
+    "get_required_scopes.return_value": ["https://www.googleapis.com/auth/calendar"],
+    "has_scope_changes.return_value": False,
+}
 
-class TestGoogleAuthManager:
-    """Test cases for GoogleAuthManager."""
+# Credential file bodies for the _is_service_account tests
+_SA_JSON = json.dumps({"type": "service_account", "project_id": "test-project"})
+_OAUTH_JSON = json.dumps(
+    {"installed": {"client_id": "test-client-id", "project_id": "test-project"}}
+)
 
-    def test_init_with_default_credentials_path(self):
-        """Test initialization with default credentials path."""
-        manager = GoogleAuthManager()
-        assert manager.credentials_path == "config/credentials.json"
-        assert manager.token_path == Path("config/token.pickle")
 
-    def test_init_with_custom_credentials_path(self):
-        """Test initialization with custom credentials path."""
-        custom_path = "custom/creds.json"
-        manager = GoogleAuthManager(credentials_path=custom_path)
-        assert manager.credentials_path == custom_path
+def _creds(**attrs):
+    """Create a Credentials mock with the given attributes set.
 
-    @patch.dict(os.environ, {"GOOGLE_CREDENTIALS_PATH": "env/creds.json"})
-    def test_init_with_env_credentials_path(self):
-        """Test initialization with environment variable."""
-        manager = GoogleAuthManager()
-        assert manager.credentials_path == "env/creds.json"
+    spec_set makes a misspelled attribute fail on both read and assignment
+    instead of returning or storing a Mock.
+    """
+    return Mock(spec_set=Credentials, **attrs)
 
-    def test_is_service_account_returns_false_when_no_file(self):
-        """Test _is_service_account when credentials file doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            creds_path = os.path.join(tmpdir, "nonexistent.json")
-            manager = GoogleAuthManager(credentials_path=creds_path)
 
-            result = manager._is_service_account()
-            assert result is False
+def make_aiofiles_mock(read=None):
+    """Create an aiofiles.open() return value and the file object it yields.
 
-    def test_is_service_account_returns_true_for_service_account(self):
-        """Test _is_service_account with service account credentials."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            creds_path = os.path.join(tmpdir, "service_account.json")
-            creds_data = {
-                "type": "service_account",
-                "project_id": "test-project",
-            }
+    aiofiles.open() is sync but returns an async context manager. MagicMock
+    already provides async __aenter__/__aexit__, and the children of an
+    AsyncMock (read, write) are AsyncMocks too.
+    """
+    mock_file = AsyncMock()
+    mock_file.read.return_value = read
 
-            with open(creds_path, "w") as f:
-                json.dump(creds_data, f)
+    mock_context = MagicMock()
+    mock_context.__aenter__.return_value = mock_file
 
-            manager = GoogleAuthManager(credentials_path=creds_path)
-            result = manager._is_service_account()
+    return mock_context, mock_file
 
-            assert result is True
 
-    def test_is_service_account_returns_false_for_oauth(self):
-        """Test _is_service_account with OAuth credentials."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            creds_path = os.path.join(tmpdir, "oauth.json")
-            creds_data = {
-                "installed": {
-                    "client_id": "test-client-id",
-                    "project_id": "test-project",
-                }
-            }
+@pytest.fixture
+def scope_manager(monkeypatch):
+    """Patch ScopeManager so GoogleAuthManager gets a preconfigured mock.
 
-            with open(creds_path, "w") as f:
-                json.dump(creds_data, f)
+    Tests override only the return values they care about.
+    """
+    mock_scope_manager = Mock(**_SCOPE_MANAGER_CONFIG)
+    monkeypatch.setattr(
+        "auth.google_auth.ScopeManager", lambda *args, **kwargs: mock_scope_manager
+    )
+    return mock_scope_manager
 
-            manager = GoogleAuthManager(credentials_path=creds_path)
-            result = manager._is_service_account()
 
-            assert result is False
+@pytest.fixture(scope="session")
+def _proto_manager():
+    """Build one default GoogleAuthManager for the whole session."""
+    return GoogleAuthManager()
 
-    def test_get_credentials_raises_when_not_initialized(self):
-        """Test get_credentials raises error when not initialized."""
+
+@pytest.fixture
+def default_manager(_proto_manager):
+    """Return a shallow copy of the default manager that a test may mutate."""
+    return copy.copy(_proto_manager)
+
+
+@pytest.fixture(scope="module")
+def credentials_dir(tmp_path_factory):
+    """Return one temporary directory shared by the credentials file tests."""
+    return tmp_path_factory.mktemp("credentials")
+
+
+@pytest.fixture
+def mock_aiofiles_open(monkeypatch):
+    """Patch aiofiles.open; tests set its return_value or side_effect."""
+    mock_open = Mock()
+    monkeypatch.setattr("auth.google_auth.aiofiles.open", mock_open)
+    return mock_open
+
+
+@pytest.fixture
+def exists_true(monkeypatch):
+    """Make os.path.exists report that every path (e.g. the token) exists."""
+    monkeypatch.setattr("auth.google_auth.os.path.exists", lambda path: True)
+
+
+@pytest.fixture
+def exists_false(monkeypatch):
+    """Make os.path.exists report that no path (e.g. the token) exists."""
+    monkeypatch.setattr("auth.google_auth.os.path.exists", lambda path: False)
+
+
+class TestGoogleAuthManager:
+    """Test cases for GoogleAuthManager."""
+
+    def test_init_with_default_credentials_path(self, _proto_manager):
+        """Test initialization with default credentials path."""
+        assert _proto_manager.credentials_path == "config/credentials.json"
+        assert _proto_manager.token_path == Path("config/token.pickle")
+
+    def test_init_with_custom_credentials_path(self):
+        """Test initialization with custom credentials path."""
+        custom_path = "custom/creds.json"
+        manager = GoogleAuthManager(credentials_path=custom_path)
+        assert manager.credentials_path == custom_path
+
+    def test_init_with_env_credentials_path(self, monkeypatch):
+        """Test initialization with environment variable."""
+        monkeypatch.setenv("GOOGLE_CREDENTIALS_PATH", "env/creds.json")
         manager = GoogleAuthManager()
+        assert manager.credentials_path == "env/creds.json"
 
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            (_SA_JSON, True),
+            (_OAUTH_JSON, False),
+            ("{ invalid json }", False),
+            ("", False),
+            (None, False),
+        ],
+        ids=["service_account", "oauth", "invalid_json", "empty_file", "no_file"],
+    )
+    def test_is_service_account(self, request, credentials_dir, content, expected):
+        """Test _is_service_account against the credentials file contents.
+
+        A content of None means the credentials file is never written.
+        """
+        # One file per case, named after its id, in the shared directory
+        creds_path = credentials_dir / f"{request.node.callspec.id}.json"
+        if content is not None:
+            creds_path.write_text(content)
+
+        manager = GoogleAuthManager(credentials_path=str(creds_path))
+
+        assert manager._is_service_account() is expected
+
+    def test_get_credentials_raises_when_not_initialized(self, _proto_manager):
+        """Test get_credentials raises error when not initialized."""
         with pytest.raises(RuntimeError, match="Authentication not initialized"):
-            manager.get_credentials()
+            _proto_manager.get_credentials()
 
-    def test_get_credentials_returns_creds_when_initialized(self):
+    def test_get_credentials_returns_creds_when_initialized(self, default_manager):
         """Test get_credentials returns credentials when initialized."""
-        manager = GoogleAuthManager()
-        mock_creds = Mock()
+        manager = default_manager
+        mock_creds = _creds()
         manager.creds = mock_creds
 
         result = manager.get_credentials()
 
         assert result == mock_creds
 
-    @patch("auth.google_auth.ScopeManager")
-    def test_get_scope_manager(self, mock_scope_manager_class):
+    def test_get_scope_manager(self, scope_manager):
         """Test get_scope_manager returns the scope manager."""
-        mock_instance = Mock()
-        mock_scope_manager_class.return_value = mock_instance
-
         manager = GoogleAuthManager()
         result = manager.get_scope_manager()
 
-        assert result == manager.scope_manager
+        assert result is scope_manager
 
-    @patch("auth.google_auth.ScopeManager")
-    def test_get_enabled_services(self, mock_scope_manager_class):
+    def test_get_enabled_services(self, scope_manager):
         """Test get_enabled_services delegates to scope manager."""
-        mock_scope_manager = Mock()
-        mock_scope_manager.get_enabled_services.return_value = ["calendar", "gmail"]
-        mock_scope_manager_class.return_value = mock_scope_manager
+        scope_manager.get_enabled_services.return_value = ["calendar", "gmail"]
 
         manager = GoogleAuthManager()
         services = manager.get_enabled_services()
 
         assert services == ["calendar", "gmail"]
-        mock_scope_manager.get_enabled_services.assert_called_once()
+        scope_manager.get_enabled_services.assert_called_once()
 
-    def test_is_service_account_handles_none_credentials_path(self):
+    def test_is_service_account_handles_none_credentials_path(self, default_manager):
         """Test _is_service_account when credentials_path is None."""
-        manager = GoogleAuthManager(credentials_path=None)
-        result = manager._is_service_account()
+        # The constructor falls back to the default path for None, so clear it
+        # on a copy of the shared manager instead
+        default_manager.credentials_path = None
+        result = default_manager._is_service_account()
         assert result is False
 
-    def test_is_service_account_handles_invalid_json(self):
-        """Test _is_service_account with invalid JSON file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            creds_path = os.path.join(tmpdir, "invalid.json")
-            with open(creds_path, "w") as f:
-                f.write("{ invalid json }")
-
-            manager = GoogleAuthManager(credentials_path=creds_path)
-            result = manager._is_service_account()
-
-            assert result is False
-
-    def test_is_service_account_handles_empty_file(self):
-        """Test _is_service_account with empty file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            creds_path = os.path.join(tmpdir, "empty.json")
-            with open(creds_path, "w") as f:
-                f.write("")
-
-            manager = GoogleAuthManager(credentials_path=creds_path)
-            result = manager._is_service_account()
-
-            assert result is False
-
     @patch("auth.google_auth.ScopeManager")
     def test_scope_manager_initialized_once(self, mock_scope_manager_class):
         """Test that scope manager is only initialized once."""
@@ -168,96 +206,50 @@ class TestGoogleAuthManager:
         mock_scope_manager_class.assert_called_once()
 
 
+@pytest.mark.asyncio(loop_scope="class")
 class TestGoogleAuthManagerInitialize:
     """Test cases for GoogleAuthManager.initialize() method."""
 
-    @pytest.mark.asyncio
-    @patch("auth.google_auth.aiofiles.open")
-    @patch("auth.google_auth.pickle.loads")
-    @patch("os.path.exists")
     async def test_initialize_loads_existing_valid_token(
-        self, mock_exists, mock_pickle_loads, mock_aiofiles_open
+        self, mock_aiofiles_open, scope_manager, exists_true, monkeypatch
     ):
         """Test initialize loads existing valid token using aiofiles."""
         # Setup mock credentials
-        mock_creds = Mock()
-        mock_creds.valid = True
-        mock_creds.scopes = ["https://www.googleapis.com/auth/calendar"]
-
-        # Mock token file exists
-        mock_exists.return_value = True
-
-        # Mock aiofiles read with proper async context manager
-        # aiofiles.open() is sync but returns an async context manager
-        mock_file = AsyncMock()
-        mock_file.read = AsyncMock(return_value=b"pickled_data")
-
-        mock_context = Mock()
-        mock_context.__aenter__ = AsyncMock(return_value=mock_file)
-        mock_context.__aexit__ = AsyncMock(return_value=None)
+        mock_creds = _creds(
+            valid=True, scopes=["https://www.googleapis.com/auth/calendar"]
+        )
 
+        # Mock aiofiles read
+        mock_context, _ = make_aiofiles_mock(read=b"pickled_data")
         mock_aiofiles_open.return_value = mock_context
 
         # Mock pickle.loads to return our credentials
-        mock_pickle_loads.return_value = mock_creds
-
-        # Setup manager with mocked scope manager
-        with patch("auth.google_auth.ScopeManager") as mock_scope_manager_class:
-            mock_scope_manager = Mock()
-            mock_scope_manager.validate_configuration.return_value = (True, [])
-            mock_scope_manager.get_required_scopes.return_value = [
-                "https://www.googleapis.com/auth/calendar"
-            ]
-            mock_scope_manager.has_scope_changes.return_value = False
-            mock_scope_manager_class.return_value = mock_scope_manager
+        monkeypatch.setattr("auth.google_auth.pickle.loads", lambda data: mock_creds)
 
-            manager = GoogleAuthManager()
-            await manager.initialize()
+        manager = GoogleAuthManager()
+        await manager.initialize()
 
-            # Verify token was loaded
-            assert manager.creds == mock_creds
-            mock_aiofiles_open.assert_called()
+        # Verify token was loaded
+        assert manager.creds == mock_creds
+        mock_aiofiles_open.assert_called()
 
-    @pytest.mark.asyncio
-    @patch("auth.google_auth.aiofiles.open")
-    @patch("auth.google_auth.pickle.dumps")
-    @patch("os.path.exists")
     async def test_initialize_saves_token_after_new_auth(
-        self, mock_exists, mock_pickle_dumps, mock_aiofiles_open
+        self, mock_aiofiles_open, scope_manager, exists_false, monkeypatch
     ):
         """Test initialize saves token after authentication using aiofiles."""
-        # Mock no existing token
-        mock_exists.return_value = False
-
-        # Mock aiofiles write with proper async context manager
-        # aiofiles.open() is sync but returns an async context manager
-        mock_file = AsyncMock()
-        mock_file.write = AsyncMock()
-
-        mock_context = Mock()
-        mock_context.__aenter__ = AsyncMock(return_value=mock_file)
-        mock_context.__aexit__ = AsyncMock(return_value=None)
-
+        # Mock aiofiles write
+        mock_context, mock_file = make_aiofiles_mock()
         mock_aiofiles_open.return_value = mock_context
 
         # Mock pickle.dumps
-        mock_pickle_dumps.return_value = b"pickled_creds"
+        monkeypatch.setattr(
+            "auth.google_auth.pickle.dumps", lambda obj: b"pickled_creds"
+        )
 
         # Mock credentials that _authenticate will set
-        mock_creds = Mock()
-        mock_creds.valid = True
-
-        with (
-            patch("auth.google_auth.ScopeManager") as mock_scope_manager_class,
-            patch.object(GoogleAuthManager, "_authenticate") as mock_auth,
-        ):
-            mock_scope_manager = Mock()
-            mock_scope_manager.validate_configuration.return_value = (True, [])
-            mock_scope_manager.get_required_scopes.return_value = [
-                "https://www.googleapis.com/auth/calendar"
-            ]
-            mock_scope_manager_class.return_value = mock_scope_manager
+        mock_creds = _creds(valid=True)
 
+        with patch.object(GoogleAuthManager, "_authenticate") as mock_auth:
             manager = GoogleAuthManager()
 
             # Set credentials when _authenticate is called
@@ -274,67 +266,41 @@ class TestGoogleAuthManagerInitialize:
             mock_aiofiles_open.assert_called()
             mock_file.write.assert_called_with(b"pickled_creds")
 
-    @pytest.mark.asyncio
-    @patch("auth.google_auth.aiofiles.open")
-    @patch("auth.google_auth.pickle.dumps")
-    @patch("auth.google_auth.pickle.loads")
-    @patch("os.path.exists")
     async def test_initialize_reauth_when_scopes_change(
-        self, mock_exists, mock_pickle_loads, mock_pickle_dumps, mock_aiofiles_open
+        self, mock_aiofiles_open, scope_manager, exists_true, monkeypatch
     ):
         """Test initialize triggers re-auth when scopes have changed."""
         # Setup mock credentials with old scopes
-        mock_creds = Mock()
-        mock_creds.valid = True
-        mock_creds.scopes = ["https://www.googleapis.com/auth/calendar"]
-
-        # Mock token exists
-        mock_exists.return_value = True
+        mock_creds = _creds(
+            valid=True, scopes=["https://www.googleapis.com/auth/calendar"]
+        )
 
-        # Mock aiofiles for both read and write with proper async context managers
-        # aiofiles.open() is sync but returns an async context manager
-        mock_read_file = AsyncMock()
-        mock_read_file.read = AsyncMock(return_value=b"old_pickled_data")
-
-        mock_write_file = AsyncMock()
-        mock_write_file.write = AsyncMock()
-
-        # Create two separate context managers for read and write operations
-        mock_read_context = Mock()
-        mock_read_context.__aenter__ = AsyncMock(return_value=mock_read_file)
-        mock_read_context.__aexit__ = AsyncMock(return_value=None)
-
-        mock_write_context = Mock()
-        mock_write_context.__aenter__ = AsyncMock(return_value=mock_write_file)
-        mock_write_context.__aexit__ = AsyncMock(return_value=None)
+        # Mock aiofiles with separate context managers for read and write
+        mock_read_context, _ = make_aiofiles_mock(read=b"old_pickled_data")
+        mock_write_context, mock_write_file = make_aiofiles_mock()
 
         # Return different contexts for each call (read first, then write)
         mock_aiofiles_open.side_effect = [mock_read_context, mock_write_context]
 
         # Mock pickle operations
-        mock_pickle_loads.return_value = mock_creds
-        mock_pickle_dumps.return_value = b"new_pickled_data"
+        monkeypatch.setattr("auth.google_auth.pickle.loads", lambda data: mock_creds)
+        monkeypatch.setattr(
+            "auth.google_auth.pickle.dumps", lambda obj: b"new_pickled_data"
+        )
 
         # New credentials after re-auth
-        new_creds = Mock()
-        new_creds.valid = True
-
-        with (
-            patch("auth.google_auth.ScopeManager") as mock_scope_manager_class,
-            patch.object(
-                GoogleAuthManager, "_authenticate", return_value=None
-            ) as mock_auth,
-        ):
-            mock_scope_manager = Mock()
-            mock_scope_manager.validate_configuration.return_value = (True, [])
-            mock_scope_manager.get_required_scopes.return_value = [
-                "https://www.googleapis.com/auth/calendar",
-                "https://www.googleapis.com/auth/gmail.readonly",
-            ]
-            # Scope change detected
-            mock_scope_manager.has_scope_changes.return_value = True
-            mock_scope_manager_class.return_value = mock_scope_manager
-
+        new_creds = _creds(valid=True)
+
+        scope_manager.get_required_scopes.return_value = [
+            "https://www.googleapis.com/auth/calendar",
+            "https://www.googleapis.com/auth/gmail.readonly",
+        ]
+        # Scope change detected
+        scope_manager.has_scope_changes.return_value = True
+
+        with patch.object(
+            GoogleAuthManager, "_authenticate", return_value=None
+        ) as mock_auth:
             manager = GoogleAuthManager()
             manager.creds = new_creds  # Set by _authenticate
 
@@ -343,20 +309,18 @@ class TestGoogleAuthManagerInitialize:
             # Verify re-authentication was triggered
             mock_auth.assert_called_once()
             # Verify new token was saved
-            assert mock_write_file.write.called
+            mock_write_file.write.assert_called_once_with(b"new_pickled_data")
 
-    @pytest.mark.asyncio
-    async def test_initialize_raises_on_invalid_scope_configuration(self):
+    async def test_initialize_raises_on_invalid_scope_configuration(
+        self, scope_manager
+    ):
         """Test initialize raises error when scope configuration is invalid."""
-        with patch("auth.google_auth.ScopeManager") as mock_scope_manager_class:
-            mock_scope_manager = Mock()
-            mock_scope_manager.validate_configuration.return_value = (
-                False,
-                ["Invalid service: unknown"],
-            )
-            mock_scope_manager_class.return_value = mock_scope_manager
+        scope_manager.validate_configuration.return_value = (
+            False,
+            ["Invalid service: unknown"],
+        )
 
-            manager = GoogleAuthManager()
+        manager = GoogleAuthManager()
 
-            with pytest.raises(RuntimeError, match="Invalid scope configuration"):
-                await manager.initialize()
+        with pytest.raises(RuntimeError, match="Invalid scope configuration"):
+            await manager.initialize()
@@ -1,79 +1,104 @@
 """Tests for holiday detection and smart scheduling functionality."""
 
-import sys
+import itertools
 from datetime import date
+from types import MappingProxyType
 from unittest.mock import Mock, patch
 
 import pytest
 
-sys.path.insert(0, "src")
-
-from tools.calendar import GoogleCalendarTools  # noqa: E402
-from utils.holiday_helpers import (  # noqa: E402
+from tools.calendar import GoogleCalendarTools
+from utils.holiday_helpers import (
+    _HOLIDAY_YEARS,
+    _build_holiday_names,
+    _next_working_ordinal,
     find_next_working_day,
     get_holiday_name,
     is_holiday,
     is_working_day,
     parse_date_from_iso,
     suggest_alternative_date,
+    try_parse_date_from_iso,
+    validate_booking_date,
+)
+
+# Dates reused across the helper tests; Christmas 2025 is a Thursday
+_CHRISTMAS_2025 = date(2025, 12, 25)
+_REGULAR_WEDNESDAY = date(2025, 10, 15)
+
+# First year after the precomputed window whose Christmas is a Tuesday, so the
+# fallback-scan tests stay outside _HOLIDAY_YEARS whatever today's date is
+_FALLBACK_YEAR = next(
+    year
+    for year in itertools.count(_HOLIDAY_YEARS.stop + 1)
+    if date(year, 12, 25).weekday() == 1
 )
 
+# Fields shared by every event returned from the mocked events().insert();
+# tests add summary plus the start/end that create_event's computed fields need
+_BASE_MOCK_EVENT = MappingProxyType({"id": "test_event_id"})
+
 
 class TestHolidayHelpers:
     """Test holiday detection utility functions."""
 
-    def test_is_holiday_christmas(self):
-        """Test that Christmas is detected as a holiday."""
-        christmas = date(2025, 12, 25)
-        assert is_holiday(christmas) is True
-
-    def test_is_holiday_us_independence_day(self):
-        """Test that July 4th is detected as a US holiday."""
-        july_4th = date(2025, 7, 4)
-        assert is_holiday(july_4th) is True
-
-    def test_is_holiday_canada_day(self):
-        """Test that Canada Day is detected as a Canadian holiday."""
-        canada_day = date(2025, 7, 1)
-        assert is_holiday(canada_day) is True
-
-    def test_is_holiday_regular_weekday(self):
-        """Test that a regular weekday is not a holiday."""
-        regular_day = date(2025, 10, 15)  # Wednesday
-        assert is_holiday(regular_day) is False
-
-    def test_get_holiday_name_christmas(self):
-        """Test getting the name of Christmas."""
-        christmas = date(2025, 12, 25)
-        name = get_holiday_name(christmas)
-        assert "Christmas" in name
-        assert "US" in name
-        assert "Canada" in name  # Observed in both countries
-
-    def test_get_holiday_name_us_only(self):
-        """Test getting the name of a US-only holiday."""
-        july_4th = date(2025, 7, 4)
-        name = get_holiday_name(july_4th)
-        assert "Independence Day" in name
-        assert "US" in name
-        assert "Canada" not in name
-
-    def test_get_holiday_name_canada_only(self):
-        """Test getting the name of a Canada-only holiday."""
-        canada_day = date(2025, 7, 1)
-        name = get_holiday_name(canada_day)
-        assert "Canada Day" in name
-        assert "Canada" in name
-        assert "US" not in name
+    @pytest.mark.parametrize(
+        "check_date,expected",
+        [
+            (_CHRISTMAS_2025, True),
+            (date(2025, 7, 4), True),
+            (date(2025, 7, 1), True),
+            (_REGULAR_WEDNESDAY, False),
+        ],
+        ids=["christmas", "us_independence_day", "canada_day", "regular_weekday"],
+    )
+    def test_is_holiday(self, check_date, expected):
+        """Test holiday detection for US, Canadian and shared holidays."""
+        assert is_holiday(check_date) is expected
+
+    @pytest.mark.parametrize(
+        "check_date,present,absent",
+        [
+            # Observed in both countries
+            (_CHRISTMAS_2025, ("Christmas", "US", "Canada"), ()),
+            (date(2025, 7, 4), ("Independence Day", "US"), ("Canada",)),
+            (date(2025, 7, 1), ("Canada Day", "Canada"), ("US",)),
+        ],
+        ids=["christmas", "us_only", "canada_only"],
+    )
+    def test_get_holiday_name(self, check_date, present, absent):
+        """Test holiday names are labelled with the countries observing them."""
+        name = get_holiday_name(check_date)
+        for fragment in present:
+            assert fragment in name
+        for fragment in absent:
+            assert fragment not in name
 
     def test_get_holiday_name_non_holiday(self):
         """Test that non-holidays return None."""
-        regular_day = date(2025, 10, 15)
+        regular_day = _REGULAR_WEDNESDAY
         assert get_holiday_name(regular_day) is None
 
+    def test_holiday_lookup_outside_precomputed_years(self):
+        """Test that dates outside the precomputed years are still detected."""
+        christmas = date(1999, 12, 25)
+        assert is_holiday(christmas) is True
+        assert "Christmas" in get_holiday_name(christmas)
+        assert is_holiday(date(1999, 10, 13)) is False
+
+    def test_holiday_names_outside_precomputed_years_are_cached(self):
+        """Test that a year outside the precomputed window is built only once."""
+        _build_holiday_names.cache_clear()
+
+        is_holiday(date(1999, 12, 25))
+        get_holiday_name(date(1999, 7, 4))
+
+        info = _build_holiday_names.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
     def test_is_working_day_weekday(self):
         """Test that a regular weekday is a working day."""
-        wednesday = date(2025, 10, 15)  # Regular Wednesday
+        wednesday = _REGULAR_WEDNESDAY
         assert is_working_day(wednesday) is True
 
     def test_is_working_day_saturday(self):
@@ -88,12 +113,12 @@ class TestHolidayHelpers:
 
     def test_is_working_day_holiday(self):
         """Test that a holiday is not a working day."""
-        christmas = date(2025, 12, 25)
+        christmas = _CHRISTMAS_2025
         assert is_working_day(christmas) is False
 
     def test_find_next_working_day_from_weekday(self):
         """Test finding next working day from a regular weekday."""
-        wednesday = date(2025, 10, 15)
+        wednesday = _REGULAR_WEDNESDAY
         next_day, days_skipped = find_next_working_day(wednesday)
         assert next_day == wednesday
         assert days_skipped == 0
@@ -115,7 +140,7 @@ class TestHolidayHelpers:
 
     def test_find_next_working_day_from_christmas(self):
         """Test finding next working day from Christmas (Thursday)."""
-        christmas = date(2025, 12, 25)  # Thursday
+        christmas = _CHRISTMAS_2025
         next_day, days_skipped = find_next_working_day(christmas)
         # Should skip to Monday (skipping Friday, Saturday, Sunday)
         assert next_day == date(2025, 12, 29)
@@ -126,11 +151,40 @@ class TestHolidayHelpers:
         # This would require a very long holiday period
         # For testing, we'll use a small max_days_ahead
         with pytest.raises(ValueError, match="No working day found"):
-            find_next_working_day(date(2025, 12, 25), max_days_ahead=2)
+            find_next_working_day(_CHRISTMAS_2025, max_days_ahead=2)
+
+    def test_find_next_working_day_reuses_cached_scan(self):
+        """Test that repeated lookups from the same date are served from cache."""
+        _next_working_ordinal.cache_clear()
+
+        first = find_next_working_day(date(2025, 12, 27))
+        second = find_next_working_day(date(2025, 12, 27))
+
+        assert first == second == (date(2025, 12, 29), 2)
+        info = _next_working_ordinal.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_find_next_working_day_outside_precomputed_years(self):
+        """Test the fallback used past the working-day table's bytes.find range.
+
+        Outside the table, weekends are skipped arithmetically and only
+        weekdays are checked against the holiday calendar.
+        """
+        christmas = date(_FALLBACK_YEAR, 12, 25)  # Tuesday, then Boxing Day
+        next_day, days_skipped = find_next_working_day(christmas)
+        assert next_day == date(_FALLBACK_YEAR, 12, 27)
+        assert days_skipped == 2
+
+    def test_find_next_working_day_skips_weekend_outside_precomputed_years(self):
+        """Test that the fallback scan jumps from Saturday straight to Monday."""
+        saturday = date(_FALLBACK_YEAR, 12, 22)
+        next_day, days_skipped = find_next_working_day(saturday)
+        assert next_day == date(_FALLBACK_YEAR, 12, 24)
+        assert days_skipped == 2
 
     def test_suggest_alternative_date_holiday(self):
         """Test suggesting alternative date for a holiday."""
-        christmas = date(2025, 12, 25)
+        christmas = _CHRISTMAS_2025
         alternative = suggest_alternative_date(christmas)
         assert alternative is not None
         assert alternative == date(2025, 12, 29)  # Monday
@@ -138,48 +192,103 @@ class TestHolidayHelpers:
 
     def test_suggest_alternative_date_working_day(self):
         """Test that working days return None for alternative."""
-        regular_day = date(2025, 10, 15)
+        regular_day = _REGULAR_WEDNESDAY
         assert suggest_alternative_date(regular_day) is None
 
+    def test_validate_booking_date_holiday(self):
+        """Test that a holiday returns its name and the next working day."""
+        name, alternative = validate_booking_date(_CHRISTMAS_2025)
+        assert "Christmas" in name
+        assert alternative == date(2025, 12, 29)  # Monday
+
+    def test_validate_booking_date_working_day(self):
+        """Test that a regular weekday needs no alternative."""
+        assert validate_booking_date(_REGULAR_WEDNESDAY) == (None, None)
+
     def test_parse_date_from_iso_date_only(self):
         """Test parsing date-only ISO string."""
         date_str = "2025-12-25"
         parsed = parse_date_from_iso(date_str)
-        assert parsed == date(2025, 12, 25)
+        assert parsed == _CHRISTMAS_2025
 
     def test_parse_date_from_iso_datetime(self):
         """Test parsing datetime ISO string."""
         date_str = "2025-12-25T10:00:00"
         parsed = parse_date_from_iso(date_str)
-        assert parsed == date(2025, 12, 25)
+        assert parsed == _CHRISTMAS_2025
 
     def test_parse_date_from_iso_datetime_with_timezone(self):
         """Test parsing datetime ISO string with timezone."""
         date_str = "2025-12-25T10:00:00-05:00"
         parsed = parse_date_from_iso(date_str)
-        assert parsed == date(2025, 12, 25)
+        assert parsed == _CHRISTMAS_2025
 
     def test_parse_date_from_iso_invalid(self):
         """Test that invalid ISO strings raise ValueError."""
         with pytest.raises(ValueError, match="Invalid ISO date string"):
             parse_date_from_iso("not-a-date")
 
+    @pytest.mark.parametrize(
+        "iso_string,expected",
+        [
+            ("2025-12-25T10:00:00-05:00", _CHRISTMAS_2025),
+            ("not-a-date", None),
+            ("2025-13-01", None),
+            ("2025-12-25T25:00:00", None),
+            ("2025-1-1", date(2025, 1, 1)),
+            ("20251225T100000", _CHRISTMAS_2025),
+        ],
+        ids=[
+            "valid",
+            "malformed",
+            "bad_month",
+            "bad_time",
+            "non_padded",
+            "compact_datetime",
+        ],
+    )
+    def test_try_parse_date_from_iso(self, iso_string, expected):
+        """Test that try_parse_date_from_iso returns None instead of raising."""
+        assert try_parse_date_from_iso(iso_string) == expected
+
 
 class TestCalendarHolidayIntegration:
     """Test holiday detection integration with calendar event creation."""
 
     def setup_method(self):
         """Set up test fixtures."""
-        self.mock_auth = Mock()
-        self.calendar_tools = GoogleCalendarTools(self.mock_auth)
-
-    @patch("tools.calendar.build")
-    def test_create_event_blocks_holiday_by_default(self, mock_build):
+        self.calendar_tools = GoogleCalendarTools(Mock())
+
+    @pytest.fixture(autouse=True)
+    def mock_build(self):
+        """Patch tools.calendar.build for every test in the class.
+
+        The events().insert().execute chain is resolved once, so tests only
+        set self.events_execute.return_value.
+        """
+        with patch("tools.calendar.build") as build:
+            mock_service = Mock()
+            build.return_value = mock_service
+            self.events_execute = (
+                mock_service.events.return_value.insert.return_value.execute
+            )
+            yield build
+
+    @pytest.mark.parametrize(
+        "day,holiday_fragment",
+        [
+            ("2025-12-25", "Christmas"),
+            ("2025-07-04", "Independence Day"),
+            ("2025-07-01", "Canada Day"),
+        ],
+        ids=["christmas", "us_independence_day", "canada_day"],
+    )
+    def test_create_event_blocks_holiday_by_default(self, day, holiday_fragment):
         """Test that creating an event on a holiday is blocked by default."""
         params = {
             "summary": "Holiday Meeting",
-            "start_time": "2025-12-25T10:00:00",  # Christmas
-            "end_time": "2025-12-25T11:00:00",
+            "start_time": f"{day}T10:00:00",
+            "end_time": f"{day}T11:00:00",
         }
 
         with pytest.raises(ValueError) as exc_info:
@@ -187,12 +296,11 @@ class TestCalendarHolidayIntegration:
 
         error_msg = str(exc_info.value)
         assert "holiday" in error_msg.lower()
-        assert "Christmas" in error_msg
-        assert "2025-12-25" in error_msg
+        assert holiday_fragment in error_msg
+        assert day in error_msg
         assert "force_holiday_booking" in error_msg
 
-    @patch("tools.calendar.build")
-    def test_create_event_suggests_alternative_date(self, mock_build):
+    def test_create_event_suggests_alternative_date(self):
         """Test that error message suggests alternative date."""
         params = {
             "summary": "Holiday Meeting",
@@ -207,23 +315,16 @@ class TestCalendarHolidayIntegration:
         assert "2025-12-29" in error_msg  # Next Monday
         assert "Monday" in error_msg
 
-    @patch("tools.calendar.build")
-    def test_create_event_allows_force_holiday_booking(self, mock_build):
+    def test_create_event_allows_force_holiday_booking(self):
         """Test that force_holiday_booking bypasses holiday check."""
-        mock_service = Mock()
-        mock_build.return_value = mock_service
-
         # Mock the event creation
         mock_event = {
-            "id": "test_event_id",
+            **_BASE_MOCK_EVENT,
             "summary": "Holiday Meeting",
-            "htmlLink": "https://calendar.google.com/event/test",
             "start": {"dateTime": "2025-12-25T10:00:00"},
             "end": {"dateTime": "2025-12-25T11:00:00"},
-            "status": "confirmed",
-            "created": "2025-10-18T12:00:00Z",
         }
-        mock_service.events().insert().execute.return_value = mock_event
+        self.events_execute.return_value = mock_event
 
         params = {
             "summary": "Holiday Meeting",
@@ -238,22 +339,15 @@ class TestCalendarHolidayIntegration:
         assert result["id"] == "test_event_id"
         assert result["summary"] == "Holiday Meeting"
 
-    @patch("tools.calendar.build")
-    def test_create_event_allows_regular_weekday(self, mock_build):
+    def test_create_event_allows_regular_weekday(self):
         """Test that regular weekdays are allowed without force flag."""
-        mock_service = Mock()
-        mock_build.return_value = mock_service
-
         mock_event = {
-            "id": "test_event_id",
+            **_BASE_MOCK_EVENT,
             "summary": "Regular Meeting",
-            "htmlLink": "https://calendar.google.com/event/test",
             "start": {"dateTime": "2025-10-15T10:00:00"},
             "end": {"dateTime": "2025-10-15T11:00:00"},
-            "status": "confirmed",
-            "created": "2025-10-18T12:00:00Z",
         }
-        mock_service.events().insert().execute.return_value = mock_event
+        self.events_execute.return_value = mock_event
 
         params = {
             "summary": "Regular Meeting",
@@ -265,33 +359,3 @@ class TestCalendarHolidayIntegration:
         result = self.calendar_tools.create_event(params)
 
         assert result["id"] == "test_event_id"
-
-    @patch("tools.calendar.build")
-    def test_create_event_blocks_us_independence_day(self, mock_build):
-        """Test that US Independence Day is blocked."""
-        params = {
-            "summary": "July 4th Meeting",
-            "start_time": "2025-07-04T10:00:00",
-            "end_time": "2025-07-04T11:00:00",
-        }
-
-        with pytest.raises(ValueError) as exc_info:
-            self.calendar_tools.create_event(params)
-
-        error_msg = str(exc_info.value)
-        assert "Independence Day" in error_msg
-
-    @patch("tools.calendar.build")
-    def test_create_event_blocks_canada_day(self, mock_build):
-        """Test that Canada Day is blocked."""
-        params = {
-            "summary": "Canada Day Meeting",
-            "start_time": "2025-07-01T10:00:00",
-            "end_time": "2025-07-01T11:00:00",
-        }
-
-        with pytest.raises(ValueError) as exc_info:
-            self.calendar_tools.create_event(params)
-
-        error_msg = str(exc_info.value)
-        assert "Canada Day" in error_msg
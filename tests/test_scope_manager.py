@@ -1,19 +1,81 @@
 """Tests for scope manager."""
 
 import json
-import tempfile
 from pathlib import Path
+from types import MappingProxyType
+
+import pytest
 
 from utils.scope_manager import ScopeManager
 
+# Single-service configurations shared by several tests
+_CALENDAR_CONFIG = MappingProxyType(
+    {
+        "enabled_services": {"calendar": True},
+        "scope_mappings": {"calendar": "https://www.googleapis.com/auth/calendar"},
+        "scope_dependencies": {},
+    }
+)
+_GMAIL_CONFIG = MappingProxyType(
+    {
+        "enabled_services": {"gmail": True},
+        "scope_mappings": {"gmail": "https://www.googleapis.com/auth/gmail.modify"},
+        "scope_dependencies": {},
+    }
+)
+_DOCS_CONFIG = MappingProxyType(
+    {
+        "enabled_services": {"docs": True},
+        "scope_mappings": {
+            "docs": "https://www.googleapis.com/auth/documents",
+            "drive": "https://www.googleapis.com/auth/drive.file",
+        },
+        "scope_dependencies": {"docs": ["drive"]},
+    }
+)
+_GMAIL_JOBS_CONFIG = MappingProxyType(
+    {**_GMAIL_CONFIG, "gmail_settings": {"restricted_label": "Jobs"}}
+)
+
+
+@pytest.fixture(scope="session")
+def default_scope_manager():
+    """Return a ScopeManager using the default config path."""
+    return ScopeManager()
+
+
+@pytest.fixture(scope="module")
+def scope_manager_factory(tmp_path_factory):
+    """Return make(config) that builds one ScopeManager per distinct config.
+
+    Managers are cached by the config's JSON text, so tests sharing a
+    configuration share one parsed instance. make(None) gives a manager
+    whose config file does not exist (defaults). Only use it in tests that
+    don't modify the manager.
+    """
+    config_dir = tmp_path_factory.mktemp("scopes")
+    managers = {}
+
+    def make(config):
+        if config is not None:
+            config = dict(config)
+        key = json.dumps(config, sort_keys=True)
+        if key not in managers:
+            config_path = config_dir / f"scopes_{len(managers)}.json"
+            if config is not None:
+                config_path.write_text(json.dumps(config))
+            managers[key] = ScopeManager(str(config_path))
+        return managers[key]
+
+    return make
+
 
 class TestScopeManager:
     """Test cases for ScopeManager."""
 
-    def test_init_with_default_config(self):
+    def test_init_with_default_config(self, default_scope_manager):
         """Test initialization with default config path."""
-        manager = ScopeManager()
-        assert manager.config_path == Path("config/scopes.json")
+        assert default_scope_manager.config_path == Path("config/scopes.json")
 
     def test_init_with_custom_config(self):
         """Test initialization with custom config path."""
@@ -21,442 +83,262 @@ class TestScopeManager:
         manager = ScopeManager(custom_path)
         assert manager.config_path == Path(custom_path)
 
-    def test_get_enabled_services_default(self):
+    def test_get_enabled_services_default(self, scope_manager_factory):
         """Test getting enabled services with default config."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "scopes.json"
-            manager = ScopeManager(str(config_path))
+        manager = scope_manager_factory(None)
 
-            # Default should enable all services
-            services = manager.get_enabled_services()
-            assert "calendar" in services
-            assert "gmail" in services
-            assert "docs" in services
+        # Default should enable all services
+        services = manager.get_enabled_services()
+        assert "calendar" in services
+        assert "gmail" in services
+        assert "docs" in services
 
-    def test_get_enabled_services_custom(self):
+    def test_get_enabled_services_custom(self, scope_manager_factory):
         """Test getting enabled services from custom config."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "scopes.json"
-            config_data = {
-                "enabled_services": {"calendar": True, "gmail": True, "docs": False},
-                "scope_mappings": {},
-                "scope_dependencies": {},
-            }
-            config_path.write_text(json.dumps(config_data))
-
-            manager = ScopeManager(str(config_path))
-            services = manager.get_enabled_services()
-
-            assert "calendar" in services
-            assert "gmail" in services
-            assert "docs" not in services
-
-    def test_get_required_scopes_calendar(self):
-        """Test getting required scopes for calendar service."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "scopes.json"
-            config_data = {
-                "enabled_services": {"calendar": True},
-                "scope_mappings": {
-                    "calendar": "https://www.googleapis.com/auth/calendar"
-                },
-                "scope_dependencies": {},
-            }
-            config_path.write_text(json.dumps(config_data))
-
-            manager = ScopeManager(str(config_path))
-            scopes = manager.get_required_scopes()
-
-            assert any("calendar" in scope.lower() for scope in scopes)
-
-    def test_get_required_scopes_gmail(self):
-        """Test getting required scopes for gmail service."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "scopes.json"
-            config_data = {
-                "enabled_services": {"gmail": True},
-                "scope_mappings": {
-                    "gmail": "https://www.googleapis.com/auth/gmail.modify"
-                },
-                "scope_dependencies": {},
-            }
-            config_path.write_text(json.dumps(config_data))
-
-            manager = ScopeManager(str(config_path))
-            scopes = manager.get_required_scopes()
-
-            assert any("gmail" in scope.lower() for scope in scopes)
-
-    def test_get_required_scopes_docs_includes_drive(self):
-        """Test that docs service includes drive scopes."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "scopes.json"
-            config_data = {
-                "enabled_services": {"docs": True},
-                "scope_mappings": {
-                    "docs": "https://www.googleapis.com/auth/documents",
-                    "drive": "https://www.googleapis.com/auth/drive.file",
-                },
-                "scope_dependencies": {"docs": ["drive"]},
-            }
-            config_path.write_text(json.dumps(config_data))
-
-            manager = ScopeManager(str(config_path))
-            scopes = manager.get_required_scopes()
-
-            # Docs requires drive
-            assert any("drive" in scope.lower() for scope in scopes)
-
-    def test_save_config(self):
+        config_data = {
+            "enabled_services": {"calendar": True, "gmail": True, "docs": False},
+            "scope_mappings": {},
+            "scope_dependencies": {},
+        }
+        manager = scope_manager_factory(config_data)
+        services = manager.get_enabled_services()
+
+        assert "calendar" in services
+        assert "gmail" in services
+        assert "docs" not in services
+
+    @pytest.mark.parametrize(
+        "config_data,expected_scope",
+        [
+            (_CALENDAR_CONFIG, "calendar"),
+            (_GMAIL_CONFIG, "gmail"),
+            (_DOCS_CONFIG, "drive"),  # Docs requires drive
+        ],
+        ids=["calendar", "gmail", "docs_includes_drive"],
+    )
+    def test_get_required_scopes(
+        self, scope_manager_factory, config_data, expected_scope
+    ):
+        """Test required scopes for each service, including dependencies."""
+        manager = scope_manager_factory(config_data)
+        scopes = manager.get_required_scopes()
+
+        assert expected_scope in "\n".join(scopes).lower()
+
+    def test_save_config(self, tmp_path):
         """Test saving configuration."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "scopes.json"
-            manager = ScopeManager(str(config_path))
-
-            config_data = {
-                "enabled_services": {"calendar": True},
-                "scope_mappings": {
-                    "calendar": "https://www.googleapis.com/auth/calendar"
-                },
-                "scope_dependencies": {},
-            }
+        config_path = tmp_path / "scopes.json"
+        manager = ScopeManager(str(config_path))
 
-            result = manager.save_config(config_data)
-            assert result is True
-            assert config_path.exists()
+        result = manager.save_config(dict(_CALENDAR_CONFIG))
+        assert result is True
+        assert config_path.exists()
 
-            # Verify saved data
-            saved_data = json.loads(config_path.read_text())
-            assert saved_data["enabled_services"] == {"calendar": True}
+        # Verify saved data
+        saved_data = json.loads(config_path.read_text())
+        assert saved_data["enabled_services"] == {"calendar": True}
 
-    def test_get_configuration_summary(self):
+    def test_get_configuration_summary(self, scope_manager_factory):
         """Test getting configuration summary."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "scopes.json"
-            config_data = {
-                "enabled_services": {"calendar": True, "gmail": True},
-                "scope_mappings": {},
-                "scope_dependencies": {},
-            }
-            config_path.write_text(json.dumps(config_data))
-
-            manager = ScopeManager(str(config_path))
-            summary = manager.get_configuration_summary()
-
-            assert "config_file" in summary
-            assert "enabled_services" in summary
-            # enabled_services is a set, convert to list for assertion
-            enabled_list = list(summary["enabled_services"])
-            assert "calendar" in enabled_list
-            assert "gmail" in enabled_list
-
-    def test_has_scope_changes_no_changes(self):
+        config_data = {
+            "enabled_services": {"calendar": True, "gmail": True},
+            "scope_mappings": {},
+            "scope_dependencies": {},
+        }
+        manager = scope_manager_factory(config_data)
+        summary = manager.get_configuration_summary()
+
+        assert "config_file" in summary
+        assert "enabled_services" in summary
+        # enabled_services is a set, convert to list for assertion
+        enabled_list = list(summary["enabled_services"])
+        assert "calendar" in enabled_list
+        assert "gmail" in enabled_list
+
+    def test_has_scope_changes_no_changes(self, scope_manager_factory):
         """Test detecting no scope changes."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "scopes.json"
-            manager = ScopeManager(str(config_path))
+        manager = scope_manager_factory(None)
 
-            scopes = manager.get_required_scopes()
-            has_changes = manager.has_scope_changes(scopes)
+        scopes = manager.get_required_scopes()
+        has_changes = manager.has_scope_changes(scopes)
 
-            assert has_changes is False
+        assert has_changes is False
 
-    def test_has_scope_changes_with_changes(self):
+    def test_has_scope_changes_with_changes(self, scope_manager_factory):
         """Test detecting scope changes."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "scopes.json"
-            manager = ScopeManager(str(config_path))
+        manager = scope_manager_factory(None)
 
-            # Different scopes should trigger change detection
-            different_scopes = ["https://www.googleapis.com/auth/calendar.readonly"]
-            has_changes = manager.has_scope_changes(different_scopes)
+        # Different scopes should trigger change detection
+        different_scopes = ["https://www.googleapis.com/auth/calendar.readonly"]
+        has_changes = manager.has_scope_changes(different_scopes)
 
-            assert has_changes is True
+        assert has_changes is True
 
-    def test_load_config_missing_file(self):
+    def test_load_config_missing_file(self, scope_manager_factory):
         """Test loading config when file doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "nonexistent.json"
-            manager = ScopeManager(str(config_path))
+        manager = scope_manager_factory(None)
 
-            # Should return default config
-            config = manager.config
-            assert "enabled_services" in config
+        # Should return default config
+        config = manager.config
+        assert "enabled_services" in config
 
-    def test_load_config_invalid_json(self):
+    def test_load_config_invalid_json(self, tmp_path):
         """Test loading config with invalid JSON."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "invalid.json"
-            config_path.write_text("{ invalid json }")
+        config_path = tmp_path / "invalid.json"
+        config_path.write_text("{ invalid json }")
 
-            manager = ScopeManager(str(config_path))
+        manager = ScopeManager(str(config_path))
 
-            # Should fall back to default config
-            config = manager.config
-            assert "enabled_services" in config
+        # Should fall back to default config
+        config = manager.config
+        assert "enabled_services" in config
+        assert config == manager._get_default_config()
 
 
 class TestGmailSettings:
     """Test cases for Gmail settings functionality."""
 
-    def test_get_gmail_settings_no_settings(self):
+    def test_get_gmail_settings_no_settings(self, scope_manager_factory):
         """Test getting Gmail settings when none are configured."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "scopes.json"
-            config_data = {
-                "enabled_services": {"gmail": True},
-                "scope_mappings": {},
-                "scope_dependencies": {},
-            }
-            config_path.write_text(json.dumps(config_data))
-
-            manager = ScopeManager(str(config_path))
-            settings = manager.get_gmail_settings()
+        manager = scope_manager_factory(_GMAIL_CONFIG)
+        settings = manager.get_gmail_settings()
 
-            assert settings == {}
+        assert settings == {}
 
-    def test_get_gmail_settings_with_restriction(self):
+    def test_get_gmail_settings_with_restriction(self, scope_manager_factory):
         """Test getting Gmail settings with restriction configured."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "scopes.json"
-            config_data = {
-                "enabled_services": {"gmail": True},
-                "scope_mappings": {},
-                "scope_dependencies": {},
-                "gmail_settings": {"restricted_label": "Jobs"},
-            }
-            config_path.write_text(json.dumps(config_data))
+        manager = scope_manager_factory(_GMAIL_JOBS_CONFIG)
+        settings = manager.get_gmail_settings()
 
-            manager = ScopeManager(str(config_path))
-            settings = manager.get_gmail_settings()
+        assert settings == {"restricted_label": "Jobs"}
 
-            assert settings == {"restricted_label": "Jobs"}
-
-    def test_get_restricted_label_none(self):
+    def test_get_restricted_label_none(self, scope_manager_factory):
         """Test getting restricted label when none configured."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "scopes.json"
-            config_data = {
-                "enabled_services": {"gmail": True},
-                "scope_mappings": {},
-                "scope_dependencies": {},
-            }
-            config_path.write_text(json.dumps(config_data))
-
-            manager = ScopeManager(str(config_path))
-            label = manager.get_restricted_label()
+        manager = scope_manager_factory(_GMAIL_CONFIG)
+        label = manager.get_restricted_label()
 
-            assert label is None
+        assert label is None
 
-    def test_get_restricted_label_configured(self):
+    def test_get_restricted_label_configured(self, scope_manager_factory):
         """Test getting restricted label when configured."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "scopes.json"
-            config_data = {
-                "enabled_services": {"gmail": True},
-                "scope_mappings": {},
-                "scope_dependencies": {},
-                "gmail_settings": {"restricted_label": "Jobs"},
-            }
-            config_path.write_text(json.dumps(config_data))
-
-            manager = ScopeManager(str(config_path))
-            label = manager.get_restricted_label()
+        manager = scope_manager_factory(_GMAIL_JOBS_CONFIG)
+        label = manager.get_restricted_label()
 
-            assert label == "Jobs"
+        assert label == "Jobs"
 
-    def test_get_restricted_labels_normalizes(self):
+    def test_get_restricted_labels_normalizes(self, tmp_path):
         """get_restricted_labels normalizes str/list/None to a list."""
         cases = [
             (None, []),
             ("Jobs", ["Jobs"]),
             (["Jobs", "_News Feed", "AI"], ["Jobs", "_News Feed", "AI"]),
         ]
+        # Each ScopeManager reads its config once, on first use, so each case can
+        # overwrite the same file
+        config_path = tmp_path / "scopes.json"
         for raw, expected in cases:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                config_path = Path(tmpdir) / "scopes.json"
-                gmail_settings = {} if raw is None else {"restricted_label": raw}
-                config_data = {
-                    "enabled_services": {"gmail": True},
-                    "scope_mappings": {},
-                    "scope_dependencies": {},
-                    "gmail_settings": gmail_settings,
-                }
-                config_path.write_text(json.dumps(config_data))
-
-                manager = ScopeManager(str(config_path))
-                assert manager.get_restricted_labels() == expected
-
-    def test_validate_gmail_settings_valid_list(self):
-        """A list of non-empty label strings validates."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "scopes.json"
-            config_data = {
-                "enabled_services": {"gmail": True},
-                "scope_mappings": {
-                    "gmail": "https://www.googleapis.com/auth/gmail.modify"
-                },
-                "scope_dependencies": {},
-                "gmail_settings": {"restricted_label": ["Jobs", "_News Feed", "AI"]},
-            }
+            gmail_settings = {} if raw is None else {"restricted_label": raw}
+            config_data = {**_GMAIL_CONFIG, "gmail_settings": gmail_settings}
             config_path.write_text(json.dumps(config_data))
 
             manager = ScopeManager(str(config_path))
-            is_valid, errors = manager.validate_configuration()
-
-            assert is_valid is True
-            assert len(errors) == 0
+            assert manager.get_restricted_labels() == expected
 
-    def test_validate_gmail_settings_list_with_bad_entries(self):
-        """A list with empty or non-string entries is rejected."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "scopes.json"
-            config_data = {
-                "enabled_services": {"gmail": True},
-                "scope_mappings": {
-                    "gmail": "https://www.googleapis.com/auth/gmail.modify"
-                },
-                "scope_dependencies": {},
-                "gmail_settings": {"restricted_label": ["Jobs", "", 123]},
+    def test_validate_gmail_settings_valid_list(self, scope_manager_factory):
+        """A list of non-empty label strings validates."""
+        manager = scope_manager_factory(
+            {
+                **_GMAIL_CONFIG,
+                "gmail_settings": {"restricted_label": ["Jobs", "_News Feed", "AI"]},
             }
-            config_path.write_text(json.dumps(config_data))
+        )
+        is_valid, errors = manager.validate_configuration()
 
-            manager = ScopeManager(str(config_path))
-            is_valid, errors = manager.validate_configuration()
+        assert is_valid is True
+        assert len(errors) == 0
 
-            assert is_valid is False
-            assert any("cannot be empty" in error for error in errors)
-            assert any("must be" in error for error in errors)
+    def test_validate_gmail_settings_list_with_bad_entries(self, scope_manager_factory):
+        """A list with empty or non-string entries is rejected."""
+        manager = scope_manager_factory(
+            {**_GMAIL_CONFIG, "gmail_settings": {"restricted_label": ["Jobs", "", 123]}}
+        )
+        is_valid, errors = manager.validate_configuration()
 
-    def test_validate_gmail_settings_valid(self):
-        """Test validating valid Gmail settings."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "scopes.json"
-            config_data = {
-                "enabled_services": {"gmail": True},
-                "scope_mappings": {
-                    "gmail": "https://www.googleapis.com/auth/gmail.modify"
-                },
-                "scope_dependencies": {},
-                "gmail_settings": {"restricted_label": "Jobs"},
-            }
-            config_path.write_text(json.dumps(config_data))
+        assert is_valid is False
+        assert any("cannot be empty" in error for error in errors)
+        assert any("must be" in error for error in errors)
 
-            manager = ScopeManager(str(config_path))
-            is_valid, errors = manager.validate_configuration()
+    def test_validate_gmail_settings_valid(self, scope_manager_factory):
+        """Test validating valid Gmail settings."""
+        manager = scope_manager_factory(_GMAIL_JOBS_CONFIG)
+        is_valid, errors = manager.validate_configuration()
 
-            assert is_valid is True
-            assert len(errors) == 0
+        assert is_valid is True
+        assert len(errors) == 0
 
-    def test_validate_gmail_settings_invalid_type(self):
+    def test_validate_gmail_settings_invalid_type(self, scope_manager_factory):
         """Test validating Gmail settings with invalid label type."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "scopes.json"
-            config_data = {
-                "enabled_services": {"gmail": True},
-                "scope_mappings": {
-                    "gmail": "https://www.googleapis.com/auth/gmail.modify"
-                },
-                "scope_dependencies": {},
-                "gmail_settings": {"restricted_label": 123},
-            }
-            config_path.write_text(json.dumps(config_data))
-
-            manager = ScopeManager(str(config_path))
-            is_valid, errors = manager.validate_configuration()
+        manager = scope_manager_factory(
+            {**_GMAIL_CONFIG, "gmail_settings": {"restricted_label": 123}}
+        )
+        is_valid, errors = manager.validate_configuration()
 
-            assert is_valid is False
-            assert any("must be a string" in error for error in errors)
+        assert is_valid is False
+        assert any("must be a string" in error for error in errors)
 
-    def test_validate_gmail_settings_empty_string(self):
+    def test_validate_gmail_settings_empty_string(self, scope_manager_factory):
         """Test validating Gmail settings with empty label string."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "scopes.json"
-            config_data = {
-                "enabled_services": {"gmail": True},
-                "scope_mappings": {
-                    "gmail": "https://www.googleapis.com/auth/gmail.modify"
-                },
-                "scope_dependencies": {},
-                "gmail_settings": {"restricted_label": ""},
-            }
-            config_path.write_text(json.dumps(config_data))
-
-            manager = ScopeManager(str(config_path))
-            is_valid, errors = manager.validate_configuration()
+        manager = scope_manager_factory(
+            {**_GMAIL_CONFIG, "gmail_settings": {"restricted_label": ""}}
+        )
+        is_valid, errors = manager.validate_configuration()
 
-            assert is_valid is False
-            assert any("cannot be empty" in error for error in errors)
+        assert is_valid is False
+        assert any("cannot be empty" in error for error in errors)
 
-    def test_validate_gmail_settings_whitespace_only(self):
+    def test_validate_gmail_settings_whitespace_only(self, scope_manager_factory):
         """Test validating Gmail settings with whitespace-only label."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "scopes.json"
-            config_data = {
-                "enabled_services": {"gmail": True},
-                "scope_mappings": {
-                    "gmail": "https://www.googleapis.com/auth/gmail.modify"
-                },
-                "scope_dependencies": {},
-                "gmail_settings": {"restricted_label": "   "},
-            }
-            config_path.write_text(json.dumps(config_data))
+        manager = scope_manager_factory(
+            {**_GMAIL_CONFIG, "gmail_settings": {"restricted_label": "   "}}
+        )
+        is_valid, errors = manager.validate_configuration()
 
-            manager = ScopeManager(str(config_path))
-            is_valid, errors = manager.validate_configuration()
-
-            assert is_valid is False
-            assert any("cannot be empty" in error for error in errors)
+        assert is_valid is False
+        assert any("cannot be empty" in error for error in errors)
 
-    def test_validate_gmail_settings_disabled_gmail(self):
+    def test_validate_gmail_settings_disabled_gmail(self, scope_manager_factory):
         """Test that Gmail settings are not validated when Gmail is disabled."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "scopes.json"
-            config_data = {
-                "enabled_services": {"gmail": False},
-                "scope_mappings": {},
-                "scope_dependencies": {},
-                "gmail_settings": {"restricted_label": ""},  # Invalid but ignored
-            }
-            config_path.write_text(json.dumps(config_data))
-
-            manager = ScopeManager(str(config_path))
-            is_valid, errors = manager.validate_configuration()
-
-            assert is_valid is True
-            assert len(errors) == 0
-
-    def test_configuration_summary_includes_gmail_settings(self):
+        config_data = {
+            "enabled_services": {"gmail": False},
+            "scope_mappings": {},
+            "scope_dependencies": {},
+            "gmail_settings": {"restricted_label": ""},  # Invalid but ignored
+        }
+        manager = scope_manager_factory(config_data)
+        is_valid, errors = manager.validate_configuration()
+
+        assert is_valid is True
+        assert len(errors) == 0
+
+    def test_configuration_summary_includes_gmail_settings(self, scope_manager_factory):
         """Test that configuration summary includes Gmail settings when Gmail is enabled."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "scopes.json"
-            config_data = {
-                "enabled_services": {"gmail": True},
-                "scope_mappings": {},
-                "scope_dependencies": {},
-                "gmail_settings": {"restricted_label": "Jobs"},
-            }
-            config_path.write_text(json.dumps(config_data))
-
-            manager = ScopeManager(str(config_path))
-            summary = manager.get_configuration_summary()
+        manager = scope_manager_factory(_GMAIL_JOBS_CONFIG)
+        summary = manager.get_configuration_summary()
 
-            assert "gmail_settings" in summary
-            assert summary["gmail_settings"]["restricted_label"] == "Jobs"
+        assert "gmail_settings" in summary
+        assert summary["gmail_settings"]["restricted_label"] == "Jobs"
 
-    def test_configuration_summary_excludes_gmail_settings_when_disabled(self):
+    def test_configuration_summary_excludes_gmail_settings_when_disabled(
+        self, scope_manager_factory
+    ):
         """Test that configuration summary excludes Gmail settings when Gmail is disabled."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "scopes.json"
-            config_data = {
-                "enabled_services": {"gmail": False, "calendar": True},
-                "scope_mappings": {},
-                "scope_dependencies": {},
-                "gmail_settings": {"restricted_label": "Jobs"},
-            }
-            config_path.write_text(json.dumps(config_data))
-
-            manager = ScopeManager(str(config_path))
-            summary = manager.get_configuration_summary()
-
-            assert "gmail_settings" not in summary
+        config_data = {
+            "enabled_services": {"gmail": False, "calendar": True},
+            "scope_mappings": {},
+            "scope_dependencies": {},
+            "gmail_settings": {"restricted_label": "Jobs"},
+        }
+        manager = scope_manager_factory(config_data)
+        summary = manager.get_configuration_summary()
+
+        assert "gmail_settings" not in summary
@@ -1,10 +1,52 @@
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from mcp.server import NotificationOptions
 
 import server as server_module
 
 
+@pytest.fixture(scope="session")
+def mcp_server():
+    """Return the module-level MCP server instance."""
+    return server_module.server
+
+
+@pytest.fixture
+def mock_auth():
+    """Patch server.auth_manager with an already-authenticated mock."""
+    with patch("server.auth_manager") as mock_auth:
+        mock_auth.creds = Mock()
+        yield mock_auth
+
+
+@pytest.fixture
+def mock_calendar():
+    """Patch server.calendar_tools with a mock."""
+    with patch("server.calendar_tools") as mock_calendar:
+        yield mock_calendar
+
+
+@pytest.fixture
+def mock_gmail():
+    """Patch server.gmail_tools with a mock."""
+    with patch("server.gmail_tools") as mock_gmail:
+        yield mock_gmail
+
+
+@pytest.fixture
+def mock_docs():
+    """Patch server.docs_tools with a mock."""
+    with patch("server.docs_tools") as mock_docs:
+        yield mock_docs
+
+
+async def _tool_text(name, arguments):
+    """Call a tool through the server handler and return its text output."""
+    result = await server_module.handle_call_tool(name, arguments)
+    return result[0].text
+
+
 class TestMCPServer:
 
     def test_server_instance_exists(self):
@@ -17,11 +59,9 @@ class TestMCPServer:
         assert callable(server_module.main)
 
     @pytest.mark.asyncio
-    async def test_server_capabilities(self):
+    async def test_server_capabilities(self, mcp_server):
         """Test server has expected capabilities"""
-        from mcp.server import NotificationOptions
-
-        capabilities = server_module.server.get_capabilities(
+        capabilities = mcp_server.get_capabilities(
             notification_options=NotificationOptions(), experimental_capabilities={}
         )
         assert capabilities is not None
@@ -31,242 +71,157 @@ class TestServerIntegration:
     """Integration tests for server functionality"""
 
     @pytest.mark.asyncio
-    async def test_handle_list_tools_with_mock_auth(self):
+    async def test_handle_list_tools_with_mock_auth(self, mock_auth):
         """Test list_tools handler with mocked authentication"""
-        with patch("server.auth_manager") as mock_auth:
-            mock_auth.get_enabled_services.return_value = ["calendar"]
+        mock_auth.get_enabled_services.return_value = ["calendar"]
 
-            tools = await server_module.handle_list_tools()
-            assert isinstance(tools, list)
-            # Should at least have the configuration tool
-            assert len(tools) >= 1
+        tools = await server_module.handle_list_tools()
+        assert isinstance(tools, list)
+        # Should at least have the configuration tool
+        assert len(tools) >= 1
 
-            # Check for configuration tool
-            config_tool_found = any(
-                tool.name == "get_mcp_configuration" for tool in tools
-            )
-            assert config_tool_found
+        # Check for configuration tool
+        config_tool_found = any(tool.name == "get_mcp_configuration" for tool in tools)
+        assert config_tool_found
 
     @pytest.mark.asyncio
-    async def test_handle_call_tool_config(self):
+    async def test_handle_call_tool_config(self, mock_auth):
         """Test calling the configuration tool"""
-        with patch("server.auth_manager") as mock_auth:
-            mock_scope_manager = Mock()
-            mock_scope_manager.get_configuration_summary.return_value = {
-                "config_file": "config/scopes.json",
-                "enabled_services": ["calendar"],
-                "is_valid": True,
-            }
-            mock_auth.get_scope_manager.return_value = mock_scope_manager
-
-            result = await server_module.handle_call_tool("get_mcp_configuration", {})
-            assert isinstance(result, list)
-            assert len(result) > 0
-
-    @pytest.mark.asyncio
-    async def test_handle_call_tool_calendar_disabled(self):
-        """Test calendar tool when service is disabled"""
-        with patch("server.auth_manager") as mock_auth:
-            mock_auth.get_enabled_services.return_value = ["gmail"]  # Only Gmail
-            mock_auth.creds = Mock()
-
-            result = await server_module.handle_call_tool("create_calendar_event", {})
-            assert isinstance(result, list)
-            assert "not enabled" in result[0].text
-
-    @pytest.mark.asyncio
-    async def test_handle_call_tool_gmail_disabled(self):
-        """Test Gmail tool when service is disabled"""
-        with patch("server.auth_manager") as mock_auth:
-            mock_auth.get_enabled_services.return_value = ["calendar"]
-            mock_auth.creds = Mock()
-
-            result = await server_module.handle_call_tool("send_email", {})
-            assert "not enabled" in result[0].text
-
-    @pytest.mark.asyncio
-    async def test_handle_call_tool_docs_disabled(self):
-        """Test Docs tool when service is disabled"""
-        with patch("server.auth_manager") as mock_auth:
-            mock_auth.get_enabled_services.return_value = ["calendar"]
-            mock_auth.creds = Mock()
-
-            result = await server_module.handle_call_tool("create_google_doc", {})
-            assert "not enabled" in result[0].text
-
-    @pytest.mark.asyncio
-    async def test_handle_call_tool_unknown(self):
-        """Test handling of unknown tool"""
-        with patch("server.auth_manager") as mock_auth:
-            mock_auth.creds = Mock()
+        mock_scope_manager = Mock()
+        mock_scope_manager.get_configuration_summary.return_value = {
+            "config_file": "config/scopes.json",
+            "enabled_services": ["calendar"],
+            "is_valid": True,
+        }
+        mock_auth.get_scope_manager.return_value = mock_scope_manager
+
+        result = await server_module.handle_call_tool("get_mcp_configuration", {})
+        assert isinstance(result, list)
+        assert len(result) > 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "tool,enabled,needle",
+        [
+            ("create_calendar_event", ["gmail"], "not enabled"),
+            ("send_email", ["calendar"], "not enabled"),
+            ("create_google_doc", ["calendar"], "not enabled"),
+            ("nonexistent_tool", ["calendar", "gmail", "docs"], "Unknown tool"),
+        ],
+        ids=["calendar_disabled", "gmail_disabled", "docs_disabled", "unknown"],
+    )
+    async def test_handle_call_tool_disabled_or_unknown(
+        self, mock_auth, tool, enabled, needle
+    ):
+        """Test tools of disabled services and unknown tools return an error"""
+        mock_auth.get_enabled_services.return_value = enabled
+
+        assert needle in await _tool_text(tool, {})
+
+    @pytest.mark.asyncio
+    async def test_calendar_create_event(self, mock_auth, mock_calendar):
+        """Test calendar create event handler"""
+        mock_auth.get_enabled_services.return_value = ["calendar"]
+        mock_calendar.create_event.return_value = {"id": "event-123", "summary": "Test"}
 
-            result = await server_module.handle_call_tool("nonexistent_tool", {})
-            assert "Unknown tool" in result[0].text
+        params = {
+            "summary": "Test",
+            "start_time": "2025-09-28T10:00:00",
+            "end_time": "2025-09-28T11:00:00",
+        }
 
-    @pytest.mark.asyncio
-    async def test_calendar_create_event(self):
-        """Test calendar create event handler"""
-        with patch("server.auth_manager") as mock_auth, patch(
-            "server.calendar_tools"
-        ) as mock_calendar:
-            mock_auth.get_enabled_services.return_value = ["calendar"]
-            mock_auth.creds = Mock()
-            mock_calendar.create_event = Mock(
-                return_value={"id": "event-123", "summary": "Test"}
-            )
-
-            params = {
-                "summary": "Test",
-                "start_time": "2025-09-28T10:00:00",
-                "end_time": "2025-09-28T11:00:00",
-            }
-
-            result = await server_module.handle_call_tool(
-                "create_calendar_event", params
-            )
-            assert "event-123" in result[0].text
+        assert "event-123" in await _tool_text("create_calendar_event", params)
 
     @pytest.mark.asyncio
-    async def test_calendar_list_calendars(self):
+    async def test_calendar_list_calendars(self, mock_auth, mock_calendar):
         """Test calendar list calendars handler"""
-        with patch("server.auth_manager") as mock_auth, patch(
-            "server.calendar_tools"
-        ) as mock_calendar:
-            mock_auth.get_enabled_services.return_value = ["calendar"]
-            mock_auth.creds = Mock()
-            mock_calendar.list_calendars = Mock(
-                return_value={
-                    "calendars": [{"id": "primary", "summary": "My Calendar"}]
-                }
-            )
-
-            result = await server_module.handle_call_tool("list_calendars", {})
-            assert "primary" in result[0].text
+        mock_auth.get_enabled_services.return_value = ["calendar"]
+        mock_calendar.list_calendars.return_value = {
+            "calendars": [{"id": "primary", "summary": "My Calendar"}]
+        }
+
+        assert "primary" in await _tool_text("list_calendars", {})
 
     @pytest.mark.asyncio
-    async def test_calendar_list_events(self):
+    async def test_calendar_list_events(self, mock_auth, mock_calendar):
         """Test calendar list events handler"""
-        with patch("server.auth_manager") as mock_auth, patch(
-            "server.calendar_tools"
-        ) as mock_calendar:
-            mock_auth.get_enabled_services.return_value = ["calendar"]
-            mock_auth.creds = Mock()
-            mock_calendar.list_events = Mock(
-                return_value={"events": [{"id": "event-1", "summary": "Meeting"}]}
-            )
-
-            result = await server_module.handle_call_tool("list_calendar_events", {})
-            assert "event-1" in result[0].text
+        mock_auth.get_enabled_services.return_value = ["calendar"]
+        mock_calendar.list_events.return_value = {
+            "events": [{"id": "event-1", "summary": "Meeting"}]
+        }
+
+        assert "event-1" in await _tool_text("list_calendar_events", {})
 
     @pytest.mark.asyncio
-    async def test_gmail_send_email(self):
+    async def test_gmail_send_email(self, mock_auth, mock_gmail):
         """Test Gmail send email handler"""
-        with patch("server.auth_manager") as mock_auth, patch(
-            "server.gmail_tools"
-        ) as mock_gmail:
-            mock_auth.get_enabled_services.return_value = ["gmail"]
-            mock_auth.creds = Mock()
-            mock_gmail.send_email = Mock(
-                return_value={"id": "msg-123", "to": "test@example.com"}
-            )
+        mock_auth.get_enabled_services.return_value = ["gmail"]
+        mock_gmail.send_email.return_value = {"id": "msg-123", "to": "test@example.com"}
 
-            params = {"to": "test@example.com", "subject": "Test", "body": "Body"}
+        params = {"to": "test@example.com", "subject": "Test", "body": "Body"}
 
-            result = await server_module.handle_call_tool("send_email", params)
-            assert "msg-123" in result[0].text
+        assert "msg-123" in await _tool_text("send_email", params)
 
     @pytest.mark.asyncio
-    async def test_gmail_search_emails(self):
+    async def test_gmail_search_emails(self, mock_auth, mock_gmail):
         """Test Gmail search emails handler"""
-        with patch("server.auth_manager") as mock_auth, patch(
-            "server.gmail_tools"
-        ) as mock_gmail:
-            mock_auth.get_enabled_services.return_value = ["gmail"]
-            mock_auth.creds = Mock()
-            mock_gmail.search_emails = Mock(
-                return_value={
-                    "messages": [{"id": "msg-1", "subject": "Test"}],
-                    "count": 1,
-                }
-            )
-
-            result = await server_module.handle_call_tool(
-                "search_emails", {"query": "test"}
-            )
-            assert "msg-1" in result[0].text
+        mock_auth.get_enabled_services.return_value = ["gmail"]
+        mock_gmail.search_emails.return_value = {
+            "messages": [{"id": "msg-1", "subject": "Test"}],
+            "count": 1,
+        }
+
+        assert "msg-1" in await _tool_text("search_emails", {"query": "test"})
 
     @pytest.mark.asyncio
-    async def test_gmail_create_draft(self):
+    async def test_gmail_create_draft(self, mock_auth, mock_gmail):
         """Test Gmail create draft handler"""
-        with patch("server.auth_manager") as mock_auth, patch(
-            "server.gmail_tools"
-        ) as mock_gmail:
-            mock_auth.get_enabled_services.return_value = ["gmail"]
-            mock_auth.creds = Mock()
-            mock_gmail.create_draft = Mock(
-                return_value={"id": "draft-123", "subject": "Draft"}
-            )
+        mock_auth.get_enabled_services.return_value = ["gmail"]
+        mock_gmail.create_draft.return_value = {"id": "draft-123", "subject": "Draft"}
 
-            params = {"to": "test@example.com", "subject": "Draft", "body": "Body"}
+        params = {"to": "test@example.com", "subject": "Draft", "body": "Body"}
 
-            result = await server_module.handle_call_tool("create_email_draft", params)
-            assert "draft-123" in result[0].text
+        assert "draft-123" in await _tool_text("create_email_draft", params)
 
     @pytest.mark.asyncio
-    async def test_docs_create_document(self):
+    async def test_docs_create_document(self, mock_auth, mock_docs):
         """Test Docs create document handler"""
-        with patch("server.auth_manager") as mock_auth, patch(
-            "server.docs_tools"
-        ) as mock_docs:
-            mock_auth.get_enabled_services.return_value = ["docs"]
-            mock_auth.creds = Mock()
-            mock_docs.create_document = Mock(
-                return_value={"documentId": "doc-123", "title": "Test"}
-            )
-
-            result = await server_module.handle_call_tool(
-                "create_google_doc", {"title": "Test"}
-            )
-            assert "doc-123" in result[0].text
+        mock_auth.get_enabled_services.return_value = ["docs"]
+        mock_docs.create_document.return_value = {
+            "documentId": "doc-123",
+            "title": "Test",
+        }
+
+        assert "doc-123" in await _tool_text("create_google_doc", {"title": "Test"})
 
     @pytest.mark.asyncio
-    async def test_docs_update_document(self):
+    async def test_docs_update_document(self, mock_auth, mock_docs):
         """Test Docs update document handler"""
-        with patch("server.auth_manager") as mock_auth, patch(
-            "server.docs_tools"
-        ) as mock_docs:
-            mock_auth.get_enabled_services.return_value = ["docs"]
-            mock_auth.creds = Mock()
-            mock_docs.update_document = Mock(
-                return_value={"documentId": "doc-123", "replies": []}
-            )
-
-            result = await server_module.handle_call_tool(
-                "update_google_doc",
-                {"document_id": "doc-123", "content": "New content"},
-            )
-            assert "doc-123" in result[0].text
+        mock_auth.get_enabled_services.return_value = ["docs"]
+        mock_docs.update_document.return_value = {
+            "documentId": "doc-123",
+            "replies": [],
+        }
+
+        assert "doc-123" in await _tool_text(
+            "update_google_doc", {"document_id": "doc-123", "content": "New content"}
+        )
 
     @pytest.mark.asyncio
-    async def test_auth_initialization_on_first_call(self):
+    async def test_auth_initialization_on_first_call(self, mock_auth, mock_calendar):
         """Test that auth initializes on first tool call"""
-        with patch("server.auth_manager") as mock_auth, patch(
-            "server.calendar_tools"
-        ) as mock_calendar:
-            mock_auth.get_enabled_services.return_value = ["calendar"]
-            mock_auth.creds = None  # Not initialized
-            mock_auth.initialize = AsyncMock()
-            mock_calendar.create_event = Mock(
-                return_value={"id": "event-123", "summary": "Test"}
-            )
-
-            params = {
-                "summary": "Test",
-                "start_time": "2025-09-28T10:00:00",
-                "end_time": "2025-09-28T11:00:00",
-            }
-
-            await server_module.handle_call_tool("create_calendar_event", params)
-
-            # Auth should have been initialized
-            mock_auth.initialize.assert_called_once()
+        mock_auth.get_enabled_services.return_value = ["calendar"]
+        mock_auth.creds = None  # Not initialized
+        mock_auth.initialize = AsyncMock()
+        mock_calendar.create_event.return_value = {"id": "event-123", "summary": "Test"}
+
+        params = {
+            "summary": "Test",
+            "start_time": "2025-09-28T10:00:00",
+            "end_time": "2025-09-28T11:00:00",
+        }
+
+        await server_module.handle_call_tool("create_calendar_event", params)
+
+        # Auth should have been initialized
+        mock_auth.initialize.assert_called_once()
@@ -0,0 +1,191 @@
+"""Tests for metadata validation in calendar update_event."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from fakes import FakeMethod
+from metadata_errors import DOMAIN_ERROR, HTTPS_ERROR, ISO_DATE_ERROR
+
+
+def _existing_event(**overrides):
+    """Build the event returned by events().get().
+
+    update_event mutates the event it fetches, so every call returns new
+    dicts, nested start/end included; keyword arguments override fields.
+    """
+    return {
+        "id": "event-123",
+        "summary": "Event",
+        "start": {"dateTime": "2025-09-28T10:00:00"},
+        "end": {"dateTime": "2025-09-28T11:00:00"},
+        **overrides,
+    }
+
+
+class TestUpdateEventValidation:
+    """Test cases for update_event metadata validation."""
+
+    @pytest.fixture
+    def events_api(self):
+        """Patch tools.calendar.build and return the service's events() resource.
+
+        events().get() returns a fresh _existing_event() unless a test sets
+        events_api.get.response.
+        """
+        events_api = SimpleNamespace(
+            get=FakeMethod(_existing_event()), update=FakeMethod({})
+        )
+        with patch("tools.calendar.build") as build:
+            build.return_value.events.return_value = events_api
+            yield events_api
+
+    def test_update_event_with_valid_metadata(self, calendar_tools, events_api):
+        """Test update_event validates metadata correctly."""
+        # Existing event returned by get()
+        existing_event = _existing_event(
+            summary="Old Title", description="Old description"
+        )
+        events_api.get.response = existing_event
+
+        # Event returned by update()
+        updated_event = existing_event.copy()
+        updated_event["description"] = (
+            "Old description\n\n---\n📋 Context:\n"
+            "Created: 2025-09-28\nProject: Q4 Planning\n"
+            "Chat: Team Meeting\nURL: https://claude.ai/chat/abc123\n"
+        )
+        events_api.update.response = updated_event
+
+        params = {
+            "calendar_id": "primary",
+            "event_id": "event-123",
+            "metadata": {
+                "created_date": "2025-09-28",
+                "project_name": "Q4 Planning",
+                "chat_title": "Team Meeting",
+                "chat_url": "https://claude.ai/chat/abc123",
+            },
+        }
+
+        calendar_tools.update_event(params)
+
+        # Verify metadata was validated and added
+        description = events_api.update.calls[-1]["body"]["description"]
+        assert "📋 Context:" in description
+        assert "Created: 2025-09-28" in description
+
+    def test_update_event_rejects_xss_in_metadata(self, calendar_tools, events_api):
+        """Test update_event prevents XSS attacks in metadata."""
+        params = {
+            "calendar_id": "primary",
+            "event_id": "event-123",
+            "metadata": {
+                "chat_title": "<script>alert('xss')</script>",
+            },
+        }
+
+        # Should not raise - but XSS should be escaped
+        calendar_tools.update_event(params)
+
+        # Verify XSS was escaped
+        description = events_api.update.calls[-1]["body"]["description"]
+        assert "&lt;script&gt;" in description
+        assert "<script>" not in description
+
+    @pytest.mark.parametrize(
+        "metadata,error",
+        [
+            (
+                {"chat_url": "https://evil.com/phishing"},
+                DOMAIN_ERROR,
+            ),
+            (
+                {"chat_url": "http://claude.ai/chat/abc"},
+                HTTPS_ERROR,
+            ),
+            (
+                {"created_date": "09/28/2025"},
+                ISO_DATE_ERROR,
+            ),
+        ],
+        ids=["malicious_url", "http_url", "invalid_date"],
+    )
+    def test_update_event_rejects_invalid_metadata(
+        self, calendar_tools, events_api, metadata, error
+    ):
+        """Test update_event rejects malicious URLs, HTTP URLs and bad dates."""
+        params = {
+            "calendar_id": "primary",
+            "event_id": "event-123",
+            "metadata": metadata,
+        }
+
+        with pytest.raises(ValueError, match=error):
+            calendar_tools.update_event(params)
+
+    @pytest.mark.parametrize(
+        "initial_description,updates,present,absent",
+        [
+            (
+                "Original description",
+                # Same raw input twice; the second update must not re-escape
+                # the metadata written by the first
+                [{"chat_title": "Q&A Session"}, {"chat_title": "Q&A Session"}],
+                ("Original description", "Q&amp;A"),
+                ("Q&amp;amp;A",),
+            ),
+            (
+                "User notes here\n\n---\n📋 Context:\n"
+                "Created: 2025-09-01\n"
+                "Project: Old Project\n"
+                "Chat: Old Chat\n",
+                [
+                    {
+                        "created_date": "2025-09-28",
+                        "project_name": "New Project",
+                        "chat_title": "New Chat",
+                        "chat_url": "https://claude.ai/chat/new123",
+                    }
+                ],
+                (
+                    "User notes here",
+                    "New Project",
+                    "New Chat",
+                    "2025-09-28",
+                    "https://claude.ai/chat/new123",
+                ),
+                ("Old Project", "Old Chat", "2025-09-01"),
+            ),
+        ],
+        ids=["repeated_updates_no_double_escaping", "replaces_old_metadata"],
+    )
+    def test_update_event_metadata_scenario(
+        self, calendar_tools, events_api, initial_description, updates, present, absent
+    ):
+        """Test successive metadata updates replace, not stack, the metadata section.
+
+        Each update's body is fed back as the event returned by the next get(),
+        as the API would store it.
+        """
+        events_api.get.response = _existing_event(description=initial_description)
+
+        for metadata in updates:
+            calendar_tools.update_event(
+                {
+                    "calendar_id": "primary",
+                    "event_id": "event-123",
+                    "metadata": metadata,
+                }
+            )
+            stored_event = events_api.update.calls[-1]["body"]
+            events_api.get.response = events_api.update.response = dict(stored_event)
+
+        description = events_api.update.calls[-1]["body"]["description"]
+
+        # User text is preserved and each expected fragment appears exactly once
+        for fragment in present:
+            assert description.count(fragment) == 1
+        for fragment in absent:
+            assert fragment not in description